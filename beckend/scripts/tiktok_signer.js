@@ -5,6 +5,7 @@
  *
  * Uso:
  *   node tiktok_signer.js "<url_com_query>" "<userAgent>"
+ *   node tiktok_signer.js --server   (processo persistente, ver serve())
  *
  * Saída:
  *   Imprime no stdout o valor da assinatura X-Bogus.
@@ -123,16 +124,7 @@ function createSandbox(urlToSign, userAgent) {
   return sandbox;
 }
 
-async function main() {
-  const urlToSign = process.argv[2];
-  const userAgent = process.argv[3] || DEFAULT_USER_AGENT;
-
-  if (!urlToSign) {
-    console.error('Uso: node tiktok_signer.js "<url>" "<userAgent>"');
-    process.exit(1);
-  }
-
-  const script = await ensureAcrawlerScript();
+function loadSigner(script, urlToSign, userAgent) {
   const sandbox = createSandbox(urlToSign, userAgent);
 
   try {
@@ -142,14 +134,90 @@ async function main() {
       timeout: 5000,
     });
   } catch (error) {
-    console.error('Erro ao inicializar acrawler:', error);
-    process.exit(2);
+    const wrapped = new Error(`Erro ao inicializar acrawler: ${error}`);
+    wrapped.exitCode = 2;
+    throw wrapped;
   }
 
   const signer = sandbox.window?.byted_acrawler?.sign;
   if (typeof signer !== 'function') {
-    console.error('Função window.byted_acrawler.sign não encontrada');
-    process.exit(3);
+    const missing = new Error('Função window.byted_acrawler.sign não encontrada');
+    missing.exitCode = 3;
+    throw missing;
+  }
+
+  return { sandbox, signer };
+}
+
+function normalizeSignature(result) {
+  if (typeof result === 'string') {
+    return result;
+  }
+  if (result && typeof result === 'object') {
+    // Alguns builds retornam objeto { X-Bogus: '...' }
+    const value = result['X-Bogus'] || result['x-bogus'] || result.value;
+    return value ? value : JSON.stringify(result);
+  }
+  return String(result);
+}
+
+/**
+ * Modo servidor: mantém o processo (e o V8 já aquecido) vivo entre assinaturas.
+ * Entrada: uma linha por requisição no formato "<url>\t<userAgent>".
+ * Saída: uma linha JSON por requisição: {"ok": true, "signature": "..."} ou {"ok": false, "error": "..."}.
+ */
+async function serve() {
+  const readline = require('readline');
+  const script = await ensureAcrawlerScript();
+  const signers = new Map();
+
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+  rl.on('line', (line) => {
+    const [urlToSign, userAgentRaw] = line.split('\t');
+    const userAgent = userAgentRaw || DEFAULT_USER_AGENT;
+    let response;
+    try {
+      if (!urlToSign) {
+        throw new Error('URL vazia');
+      }
+      let entry = signers.get(userAgent);
+      if (!entry) {
+        entry = loadSigner(script, urlToSign, userAgent);
+        signers.set(userAgent, entry);
+      }
+      entry.sandbox.location.href = urlToSign;
+      const signature = normalizeSignature(entry.signer({ url: urlToSign, ua: userAgent }));
+      response = { ok: true, signature };
+    } catch (error) {
+      response = { ok: false, error: String(error && error.message ? error.message : error) };
+    }
+    process.stdout.write(`${JSON.stringify(response)}\n`);
+  });
+  rl.on('close', () => process.exit(0));
+}
+
+async function main() {
+  if (process.argv[2] === '--server') {
+    await serve();
+    return;
+  }
+
+  const urlToSign = process.argv[2];
+  const userAgent = process.argv[3] || DEFAULT_USER_AGENT;
+
+  if (!urlToSign) {
+    console.error('Uso: node tiktok_signer.js "<url>" "<userAgent>"');
+    process.exit(1);
+  }
+
+  const script = await ensureAcrawlerScript();
+
+  let signer;
+  try {
+    ({ signer } = loadSigner(script, urlToSign, userAgent));
+  } catch (error) {
+    console.error(error.message);
+    process.exit(error.exitCode || 2);
   }
 
   let result;
@@ -160,19 +228,7 @@ async function main() {
     process.exit(4);
   }
 
-  if (typeof result === 'string') {
-    process.stdout.write(result);
-  } else if (result && typeof result === 'object') {
-    // Alguns builds retornam objeto { X-Bogus: '...' }
-    const value = result['X-Bogus'] || result['x-bogus'] || result.value;
-    if (!value) {
-      process.stdout.write(JSON.stringify(result));
-    } else {
-      process.stdout.write(value);
-    }
-  } else {
-    process.stdout.write(String(result));
-  }
+  process.stdout.write(normalizeSignature(result));
 }
 
 main().catch((error) => {
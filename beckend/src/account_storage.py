@@ -9,12 +9,24 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson  # parse direto de bytes, sem decodificar para str antes
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 TEMPLATE_IGNORE_KEYS = {"value", "expires", "expiry", "expirationDate"}
 DEFAULT_COOKIE_DOMAIN = ".tiktok.com"
 DEFAULT_COOKIE_PATH = "/"
 
 
+def _read_json(path: Path) -> Any:
+    """Lê e decodifica um JSON (orjson quando disponível)."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 class AccountStorage:
     """Gerencia a estrutura de pastas e arquivos de cada conta TikTok"""
 
@@ -63,7 +75,7 @@ class AccountStorage:
 
         for cookie_file in candidates:
             try:
-                data = json.loads(cookie_file.read_text(encoding="utf-8"))
+                data = _read_json(cookie_file)
             except Exception:
                 continue
 
@@ -271,16 +283,14 @@ Criado em: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
         structure = self.get_account_structure(account_name)
         latest_link = structure["cookies"] / "cookies_latest.json"
 
-        if not latest_link.exists():
-            return None
-
         try:
-            with open(latest_link, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-                # Mantém compatibilidade com formatos antigos
-                return {"cookies": data}
+            data = _read_json(latest_link)
+            if isinstance(data, dict):
+                return data
+            # Mantém compatibilidade com formatos antigos
+            return {"cookies": data}
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Erro ao ler cookies de {account_name}: {e}")
             return None
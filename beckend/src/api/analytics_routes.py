@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.analytics import VideoAnalytics
@@ -155,7 +156,9 @@ async def get_recent_videos(
 
     scraper = TikTokScraper()
     try:
-        fetched = scraper.fetch_recent_posts(
+        # Scraper é bloqueante (requests); roda no threadpool para não travar o event loop
+        fetched = await run_in_threadpool(
+            scraper.fetch_recent_posts,
             account.account_name,
             count=max(limit + len(pinned_ids), 9),
             account_name=account.account_name,
@@ -241,7 +244,8 @@ async def pin_recent_video(
 
     scraper = TikTokScraper()
     try:
-        fetched = scraper.fetch_recent_posts(
+        fetched = await run_in_threadpool(
+            scraper.fetch_recent_posts,
             account.account_name,
             count=12,
             account_name=account.account_name,
@@ -394,7 +398,7 @@ async def refresh_account_metrics_endpoint(
     account = _ensure_account_access(db, account_name, current_user)
 
     try:
-        metric, _profile = refresh_account_metrics(db, account)
+        metric, _profile = await run_in_threadpool(refresh_account_metrics, db, account)
     except TikTokScraperError as exc:
         raise_http_error(502, error="tiktok_scraper_error", message=str(exc))
 
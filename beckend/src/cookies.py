@@ -6,7 +6,7 @@ Mudanças vs cookies.py (573 linhas):
 - 90% mais simples (~50 linhas vs 573)
 - Sem sistema de normalização complexo
 - Sem localStorage/sessionStorage
-- Sem CDP fallbacks
+- Cookies injetados num único Network.setCookies (CDP), add_cookie só como fallback
 - Sem markers de cookies inválidos
 - Carrega direto do arquivo ou banco
 """
@@ -19,9 +19,98 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from .account_storage import AccountStorage
+
 logger = logging.getLogger("cookies_simple")
 
 
+# Campos que o Selenium não aceita (como tiktok_bot)
+_DROPPED_COOKIE_FIELDS = ("sameSite", "expiry", "expirationDate", "hostOnly", "storeId")
+
+# Campos repassados ao Network.setCookies (mesmos que sobram após _clean_cookie)
+_CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly")
+
+# sameSite nos formatos do Selenium e de exportadores de extensão -> enum do CDP
+_CDP_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None", "no_restriction": "None"}
+
+
+def _clean_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove campos que o add_cookie do Selenium rejeita."""
+    cookie_clean = dict(cookie)
+    for field in _DROPPED_COOKIE_FIELDS:
+        cookie_clean.pop(field, None)
+    return cookie_clean
+
+
+def _set_cookies_via_cdp(
+    driver: WebDriver,
+    cookies_list: List[Dict[str, Any]],
+    base_url: str,
+) -> Optional[int]:
+    """
+    Injeta todos os cookies num único comando CDP.
+
+    Returns:
+        Quantidade enviada, ou None se o CDP não estiver disponível/falhar
+        (o chamador cai no add_cookie um a um).
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+
+    cdp_cookies = []
+    for cookie in cookies_list:
+        if not isinstance(cookie, dict) or not cookie.get("name"):
+            continue
+        cdp_cookie = {key: cookie[key] for key in _CDP_COOKIE_FIELDS if key in cookie}
+        cdp_cookie["value"] = str(cdp_cookie.get("value", ""))
+        # O CDP aceita expiração e sameSite (o add_cookie não): mantém o cookie persistente
+        expires = cookie.get("expiry", cookie.get("expirationDate"))
+        if isinstance(expires, (int, float)) and not isinstance(expires, bool):
+            cdp_cookie["expires"] = expires
+        same_site = _CDP_SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+        # sameSite=None sem secure faz o Chrome recusar o cookie
+        if same_site and (same_site != "None" or cdp_cookie.get("secure")):
+            cdp_cookie["sameSite"] = same_site
+        if not cdp_cookie.get("domain"):
+            cdp_cookie.pop("domain", None)
+            cdp_cookie["url"] = base_url
+        cdp_cookies.append(cdp_cookie)
+
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+    except Exception as e:
+        logger.debug(f"Network.setCookies falhou, usando add_cookie: {e}")
+        return None
+    return len(cdp_cookies)
+
+
+def _clear_browser_cookies(driver: WebDriver, on_http_page: bool) -> bool:
+    """
+    Remove os cookies do navegador antes de carregar os da conta.
+
+    O perfil do Chrome é persistente (--user-data-dir), então mesmo um driver novo
+    pode trazer cookies de outra sessão. Network.clearBrowserCookies (CDP) limpa
+    todos os domínios e funciona em about:blank; delete_all_cookies só vale para a
+    origem http atual.
+
+    Returns:
+        True se conseguiu limpar
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            return True
+        except Exception as e:
+            logger.debug(f"Network.clearBrowserCookies falhou: {e}")
+    if on_http_page:
+        try:
+            driver.delete_all_cookies()
+            return True
+        except Exception:
+            pass
+    return False
+
+
 def load_cookies_for_account(
     driver: WebDriver,
     account_name: str,
@@ -42,7 +131,6 @@ def load_cookies_for_account(
     print(f"🔍 Carregando cookies para: {account_name}")
 
     # 1. Busca cookies do banco de dados
-    from .account_storage import AccountStorage
     storage = AccountStorage()
     auth_bundle = storage.get_latest_cookies(account_name)
 
@@ -61,58 +149,64 @@ def load_cookies_for_account(
         print(f"❌ Formato de cookies inválido: {account_name}")
         return False
 
-    # 3. Navega para TikTok
     try:
-        logger.info(f"🌐 Navegando para {base_url}...")
-        print(f"🌐 Navegando para {base_url}...")
-        driver.set_page_load_timeout(30)
-        driver.get(base_url)
-        time.sleep(2)
-    except Exception as e:
-        logger.error(f"❌ Erro ao navegar: {e}")
-        print(f"❌ Erro ao navegar: {e}")
-        return False
+        current_url = driver.current_url or ""
+    except Exception:
+        current_url = ""
 
-    # 4. Limpa cookies existentes
-    try:
-        driver.delete_all_cookies()
-    except:
-        pass
+    # 3. Limpa cookies existentes (inclusive os herdados do perfil persistente)
+    cleared = _clear_browser_cookies(driver, current_url.startswith("http"))
 
-    # 5. Adiciona cookies (SIMPLES - remove apenas campos problemáticos)
+    # 4. Adiciona cookies: um único Network.setCookies (CDP) em vez de um
+    # add_cookie por cookie. O CDP não exige estar no domínio, então os cookies
+    # entram antes da navegação e a página já carrega autenticada (sem refresh).
     logger.info(f"🍪 Adicionando {len(cookies_list)} cookies...")
     print(f"🍪 Adicionando {len(cookies_list)} cookies...")
+    cookies_added = _set_cookies_via_cdp(driver, cookies_list, base_url)
+    via_cdp = cookies_added is not None
 
-    cookies_added = 0
-    for cookie in cookies_list:
+    # 5. Navega para TikTok (o fallback add_cookie precisa estar no domínio;
+    # pula a navegação se a aba já está no TikTok)
+    if via_cdp or "tiktok.com" not in current_url:
         try:
-            # Remove campos que o Selenium não aceita (como tiktok_bot)
-            cookie_clean = dict(cookie)
-            cookie_clean.pop('sameSite', None)
-            cookie_clean.pop('expiry', None)
-            cookie_clean.pop('expirationDate', None)
-            cookie_clean.pop('hostOnly', None)
-            cookie_clean.pop('storeId', None)
-
-            driver.add_cookie(cookie_clean)
-            cookies_added += 1
+            logger.info(f"🌐 Navegando para {base_url}...")
+            print(f"🌐 Navegando para {base_url}...")
+            driver.set_page_load_timeout(30)
+            driver.get(base_url)
         except Exception as e:
-            # Ignora cookies que falharem (não trava por causa de 1 cookie)
-            logger.debug(f"Cookie {cookie.get('name')} falhou: {e}")
-            continue
+            logger.error(f"❌ Erro ao navegar: {e}")
+            print(f"❌ Erro ao navegar: {e}")
+            return False
+
+    if not via_cdp:
+        if not cleared:
+            # Agora na origem do TikTok: delete_all_cookies já funciona
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass
+        cookies_added = 0
+        for cookie in cookies_list:
+            try:
+                driver.add_cookie(_clean_cookie(cookie))
+                cookies_added += 1
+            except Exception as e:
+                # Ignora cookies que falharem (não trava por causa de 1 cookie)
+                logger.debug(f"Cookie {cookie.get('name')} falhou: {e}")
+                continue
 
     logger.info(f"🍪 {cookies_added}/{len(cookies_list)} cookies adicionados")
     print(f"🍪 {cookies_added}/{len(cookies_list)} cookies adicionados")
 
-    # 6. Recarrega página com cookies
-    logger.info("🔄 Recarregando com cookies...")
-    print("🔄 Recarregando com cookies...")
-    try:
-        driver.refresh()
-        time.sleep(3)
-    except Exception as e:
-        logger.warning(f"⚠️ Erro ao recarregar: {e}")
-        print(f"⚠️ Erro ao recarregar: {e}")
+    # 6. Recarrega página com cookies (só no fallback add_cookie)
+    if not via_cdp:
+        logger.info("🔄 Recarregando com cookies...")
+        print("🔄 Recarregando com cookies...")
+        try:
+            driver.refresh()
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao recarregar: {e}")
+            print(f"⚠️ Erro ao recarregar: {e}")
 
     # 7. Verifica se está logado (procura ícone de upload)
     logger.info("✅ Verificando login...")
@@ -159,7 +253,6 @@ def save_cookies_for_account(driver: WebDriver, account_name: str) -> bool:
         # Salva no formato simples (apenas cookies, sem localStorage/sessionStorage)
         payload = {"cookies": cookies}
 
-        from .account_storage import AccountStorage
         storage = AccountStorage()
         cookies_path = storage.save_cookies(account_name, payload)
 
@@ -191,11 +191,11 @@ def is_session_alive(driver: Optional[webdriver.Chrome]) -> bool:
     Returns:
         True se sessão está viva, False caso contrário
     """
-    if driver is None:
+    # Sem session_id (driver encerrado/nunca iniciado) não vale o round-trip
+    if driver is None or getattr(driver, "session_id", None) is None:
         return False
 
     try:
-        _ = driver.session_id
         driver.execute_script("return 1")
         return True
     except (InvalidSessionIdException, WebDriverException):
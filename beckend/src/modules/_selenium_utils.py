@@ -0,0 +1,94 @@
+"""
+Utilitários Selenium compartilhados pelos módulos de postagem.
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+
+
+# Visibilidade calculada no navegador: Element.checkVisibility (Chrome 105+) resolve
+# display/visibility sem getComputedStyle; navegadores antigos usam o teste anterior
+IS_VISIBLE_JS = """
+const isVisible = (el) => el.checkVisibility
+    ? el.checkVisibility({checkVisibilityCSS: true})
+    : el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+# Textos de todos os XPaths de status (e o body) num único round-trip, em vez de
+# find_elements + um .text por elemento. Ignora nós não renderizados, como .text.
+STATUS_TEXTS_FN_JS = """
+const statusTexts = (xpaths) => {
+    const texts = [];
+    for (const xp of xpaths) {
+        let snap;
+        try {
+            snap = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        } catch (e) {
+            continue;
+        }
+        for (let i = 0; i < snap.snapshotLength; i++) {
+            const el = snap.snapshotItem(i);
+            if (el.nodeType !== 1 || !isVisible(el)) continue;
+            const text = (el.innerText || '').trim();
+            if (text) texts.push(text);
+        }
+    }
+    return [texts, document.body ? document.body.innerText : ''];
+};
+"""
+STATUS_TEXTS_JS = IS_VISIBLE_JS + STATUS_TEXTS_FN_JS + "return statusTexts(arguments[0]);"
+
+
+def write_bytes_async(
+    path: str,
+    data: bytes,
+    log: Optional[Callable[[str], None]] = None,
+    label: str = "Artefato",
+) -> None:
+    """
+    Grava artefato de debug (screenshot etc.) numa thread daemon, fora do fluxo de
+    postagem. Com `log`, informa o resultado só depois da gravação (ou da falha).
+    """
+    def _write() -> None:
+        try:
+            with open(path, "wb") as fh:
+                fh.write(data)
+        except OSError as exc:
+            if log:
+                log(f"⚠️ Falha ao salvar {label}: {path} ({exc})")
+            return
+        if log:
+            log(f"📸 {label} salvo: {path}")
+
+    threading.Thread(target=_write, name="debug-dump", daemon=True).start()
+
+
+class WaitPool:
+    """
+    WebDriverWait reaproveitado para os timeouts padrão do módulo; timeouts fora
+    da lista ganham uma instância nova (mesmo poll e exceções ignoradas).
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeouts: Iterable[float] = (),
+        poll_frequency: float = POLL_FREQUENCY,
+        ignored_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
+    ):
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self.ignored_exceptions = ignored_exceptions
+        self._waits: Dict[float, WebDriverWait] = {t: self.new(t) for t in timeouts}
+
+    def new(self, timeout: float) -> WebDriverWait:
+        return WebDriverWait(
+            self.driver, timeout, self.poll_frequency, ignored_exceptions=self.ignored_exceptions
+        )
+
+    def get(self, timeout: float) -> WebDriverWait:
+        wait = self._waits.get(timeout)
+        return wait if wait is not None else self.new(timeout)
@@ -11,19 +11,20 @@ Mudanças v2.1:
 """
 
 import re
-import time
 from enum import Enum
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Tuple
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from ._selenium_utils import WaitPool
+
 # ===== Constantes =====
 WAIT_SHORT = 3  # Reduzido para eficiência
 
-AUDIENCE_SELECTORS = [
+AUDIENCE_SELECTORS = (
     (By.CSS_SELECTOR, "div[data-e2e='privacy-selector']"),
     (By.CSS_SELECTOR, "div[data-e2e='audience-selector']"),
     (By.CSS_SELECTOR, "div[class*='audience-dropdown']"),
@@ -33,21 +34,43 @@ AUDIENCE_SELECTORS = [
     (By.CSS_SELECTOR, "div[role='button'][data-e2e*='privacy']"),
     (By.XPATH, "//div[contains(@aria-label, 'Who can view') or contains(@aria-label, 'Quem pode assistir')]"),
     (By.XPATH, "//div[contains(text(), 'Who can view') or contains(text(), 'Quem pode assistir')]"),
-]
+)
+
+# Containers lidos para detectar a audiência atual (body como fallback)
+PAGE_TEXT_XPATHS = (
+    "//div[contains(@data-e2e, 'audience') or contains(@data-e2e, 'privacy')]",
+    "//*[contains(@class, 'audience') or contains(@class, 'privacy')]",
+    "//*[contains(text(), 'Who can') or contains(text(), 'Quem pode')]",
+    "//body",
+)
+
+# Texto de todos os PAGE_TEXT_XPATHS concatenado no navegador (um round-trip,
+# em vez de find_elements + um .text por elemento)
+PAGE_TEXT_JS = """
+const parts = [];
+for (const xp of arguments[0]) {
+    const snap = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        const el = snap.snapshotItem(i);
+        if (el.getClientRects().length) parts.push(el.innerText || '');
+    }
+}
+return parts.join(' ');
+"""
 
 OPTION_SELECTORS = {
-    "public": [
+    "public": (
         (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'everyone') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'public') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'todo mundo')]"),
         (By.CSS_SELECTOR, "[data-e2e*='public']"),
-    ],
-    "friends": [
+    ),
+    "friends": (
         (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'friends') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'amigos') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'friends only')]"),
         (By.CSS_SELECTOR, "[data-e2e*='friends']"),
-    ],
-    "private": [
+    ),
+    "private": (
         (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'private') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'privado') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'only you')]"),
         (By.CSS_SELECTOR, "[data-e2e*='private']"),
-    ],
+    ),
 }
 
 class AudienceType(Enum):
@@ -59,18 +82,31 @@ class AudienceType(Enum):
 
 # Textos por tipo (multi-idioma / variações)
 AUDIENCE_TEXTS = {
-    AudienceType.PUBLIC: [
+    AudienceType.PUBLIC: (
         "everyone", "public", "para todos", "público", "todo mundo",
         "all", "view all", "qualquer pessoa", "todos"
-    ],
-    AudienceType.FRIENDS: [
+    ),
+    AudienceType.FRIENDS: (
         "friends", "amigos", "friends only", "só amigos", "somente amigos",
         "apenas amigos", "apenas seguidores que te seguem", "seguidores que te seguem de volta"
-    ],
-    AudienceType.PRIVATE: [
+    ),
+    AudienceType.PRIVATE: (
         "private", "privado", "only you", "só você", "somente você",
         "apenas você", "me only"
-    ],
+    ),
+}
+
+# Padrões de detecção e XPaths de opção montados uma vez por tipo, em vez de a cada chamada
+_AUDIENCE_PATTERNS = {
+    audience_type: re.compile("|".join(re.escape(t) for t in texts), re.IGNORECASE)
+    for audience_type, texts in AUDIENCE_TEXTS.items()
+}
+_AUDIENCE_OPTION_XPATHS = {
+    audience_type: "//*[" + " or ".join(
+        f"contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{t.lower()}')"
+        for t in texts
+    ) + "]"
+    for audience_type, texts in AUDIENCE_TEXTS.items()
 }
 
 
@@ -91,13 +127,14 @@ class AudienceModule:
         self.driver = driver
         self.log = logger if logger else print
         self._cached_page_text = ""  # Cache para eficiência em detect/verify
+        self._waits = WaitPool(driver, (WAIT_SHORT,))
 
     # ===================== MÉTODOS UTILITÁRIOS =====================
 
     def _wait_clickable(self, by: By, value: str, timeout: int = WAIT_SHORT) -> Optional[object]:
         """Espera elemento clicável (EC reativo)"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self._waits.get(timeout).until(
                 EC.element_to_be_clickable((by, value))
             )
         except TimeoutException:
@@ -114,14 +151,16 @@ class AudienceModule:
             return self._cached_page_text
 
         try:
-            selectors = [
-                "//div[contains(@data-e2e, 'audience') or contains(@data-e2e, 'privacy')]",
-                "//*[contains(@class, 'audience') or contains(@class, 'privacy')]",
-                "//*[contains(text(), 'Who can') or contains(text(), 'Quem pode')]",
-                "//body",  # Fallback body
-            ]
+            page_text = self.driver.execute_script(PAGE_TEXT_JS, PAGE_TEXT_XPATHS) or ""
+            self._cached_page_text = self._normalize_text(page_text)
+            return self._cached_page_text
+        except Exception:
+            pass
+
+        # Fallback: um .text por elemento
+        try:
             page_text = ""
-            for selector in selectors:
+            for selector in PAGE_TEXT_XPATHS:
                 elements = self.driver.find_elements(By.XPATH, selector)
                 for element in elements:
                     try:
@@ -151,20 +190,19 @@ class AudienceModule:
 
         # Partial match com regex (sem \b rígido, para não perder variações)
         for audience_type in AudienceType:
-            texts = self._get_audience_texts(audience_type)
-            pattern = "(" + "|".join(re.escape(t) for t in texts) + ")"
-            if re.search(pattern, page_text, re.IGNORECASE):
+            pattern = _AUDIENCE_PATTERNS.get(audience_type)
+            if pattern is not None and pattern.search(page_text):
                 self.log(f"🔍 Detectado: {audience_type.value}")
                 return audience_type
 
         self.log("⚠️ Não detectado – texto não match")
         return None
 
-    def _get_audience_texts(self, audience_type: AudienceType) -> List[str]:
+    def _get_audience_texts(self, audience_type: AudienceType) -> Tuple[str, ...]:
         """
         Textos por tipo (multi-idioma, partial).
         """
-        return AUDIENCE_TEXTS.get(audience_type, [])
+        return AUDIENCE_TEXTS.get(audience_type, ())
 
     # ===================== SELEÇÃO DE AUDIÊNCIA =====================
 
@@ -185,24 +223,22 @@ class AudienceModule:
         """
         Clica na opção (partial XPath, EC 3s).
         """
-        texts = self._get_audience_texts(audience_type)
-        if not texts:
+        xpath = _AUDIENCE_OPTION_XPATHS.get(audience_type)
+        if not xpath:
             self.log(f"⚠️ Sem textos configurados para: {audience_type.value}")
             return False
 
-        conditions = [
-            f"contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{t.lower()}')"
-            for t in texts
-        ]
-        xpath = f"//*[{' or '.join(conditions)}]"
-
         try:
             option = self._wait_clickable(By.XPATH, xpath, timeout=3)
             if not option:
                 raise TimeoutException("Opção não clicável no timeout")
             option.click()
             self.log(f"✅ Opção clicada: {audience_type.value}")
-            time.sleep(0.5)  # Sync mínimo
+            # Sync mínimo: retorna assim que o dropdown fecha (máx 0.5s, como antes)
+            try:
+                WebDriverWait(self.driver, 0.5, poll_frequency=0.05).until(EC.invisibility_of_element(option))
+            except TimeoutException:
+                pass
             return True
         except TimeoutException:
             self.log(f"⚠️ Opção '{audience_type.value}' não encontrada")
@@ -229,8 +265,8 @@ class AudienceModule:
             return True
 
         try:
+            # Sem sleep: _click_audience_option já espera a opção ficar clicável
             selector.click()
-            time.sleep(0.5)
         except Exception as e:
             self.log(f"⚠️ Erro abrir dropdown: {e}")
             if required:
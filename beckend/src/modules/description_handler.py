@@ -1,23 +1,22 @@
 """
 Módulo 2: Tratamento da Descrição (Versão Otimizada v2.3.1 - Fix Import)
 Lida exclusivamente com a criação, edição e formatação da descrição do vídeo
-Otimizações: Timeout 3s em locate, 2 retries max, no relocate em verify (cache sempre), JS simplificado sem blur/sleep, handle single locate.
+Otimizações: Timeout 3s em locate (seletores avaliados num único script), no relocate em verify (cache sempre), JS simplificado sem blur/sleep, handle single locate.
 """
 import re
-import time  # Fix: Adicionado para time.time()
 import unicodedata
 from typing import Optional, Callable, Tuple
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+
+from ._selenium_utils import WaitPool
 
 # Constantes
 WAIT_SHORT = 3  # Reduzido para eficiência
 MAX_LENGTH = 2200
 
-DESCRIPTION_SELECTORS = [
+DESCRIPTION_SELECTORS = (
     (By.CSS_SELECTOR, "div[data-e2e='description-input']"),
     (By.CSS_SELECTOR, "div[data-e2e='caption-input']"),
     (By.CSS_SELECTOR, "div[contenteditable='true'][placeholder*='add description']"),
@@ -31,7 +30,35 @@ DESCRIPTION_SELECTORS = [
     (By.CSS_SELECTOR, "textarea[placeholder*='description']"),
     (By.XPATH, "//div[@contenteditable='true' and contains(@placeholder, 'description')]"),
     (By.XPATH, "//div[contains(@class, 'caption') and @contenteditable='true']"),
-]
+)
+
+# Todos os seletores avaliados no browser, na ordem de prioridade, num único script
+# por poll (em vez de uma espera de até 1s por seletor). Retorna [elemento, índice].
+_DESCRIPTION_SPECS = tuple(
+    ("xpath" if by == By.XPATH else "css", value) for by, value in DESCRIPTION_SELECTORS
+)
+_FIND_VISIBLE_FIELD_JS = """
+const specs = arguments[0];
+const visible = (el) => el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden';
+for (let i = 0; i < specs.length; i++) {
+    const [kind, value] = specs[i];
+    if (kind === 'xpath') {
+        const snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let j = 0; j < snap.snapshotLength; j++) {
+            if (visible(snap.snapshotItem(j))) return [snap.snapshotItem(j), i];
+        }
+    } else {
+        for (const el of document.querySelectorAll(value)) {
+            if (visible(el)) return [el, i];
+        }
+    }
+}
+return null;
+"""
+
+# Pré-compilados: sanitize_description roda a cada upload sobre legendas de até 2200 chars
+_STRIP_CHARS_RE = re.compile(r'[\x00-\x1F\x7F\U00010000-\U0010FFFF]')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 class DescriptionModule:
@@ -51,6 +78,7 @@ class DescriptionModule:
         self.driver = driver
         self.log = logger if logger else print
         self._cached_field = None  # Cache para eficiência
+        self._waits = WaitPool(driver, (WAIT_SHORT,))
 
     # ===================== VALIDAÇÃO E SANITIZAÇÃO =====================
 
@@ -68,14 +96,11 @@ class DescriptionModule:
         if not text:
             return ""
 
-        # Remove emojis BMP+ (U+10000+)
-        sanitized = re.sub(r'[\U00010000-\U0010FFFF]', '', text)
-
-        # Remove control chars (exceto \n\t)
-        sanitized = re.sub(r'[\x00-\x1F\x7F]', '', sanitized)
+        # Remove emojis fora do BMP (U+10000+) e control chars numa única passada
+        sanitized = _STRIP_CHARS_RE.sub('', text)
 
         # Remove espaços extras
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        sanitized = _WHITESPACE_RE.sub(' ', sanitized).strip()
 
         return sanitized
 
@@ -128,18 +153,9 @@ class DescriptionModule:
 
     # ===================== LOCALIZAÇÃO DO CAMPO =====================
 
-    def _wait_visible(self, by: By, value: str, timeout: int = WAIT_SHORT) -> Optional[object]:
-        """Espera visível (EC reativo, 3s)"""
-        try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
-        except TimeoutException:
-            return None
-
     def find_description_field(self, timeout: int = WAIT_SHORT, use_cache: bool = True) -> Optional[object]:
         """
-        Localiza campo (cache + 2 retries, timeout 3s).
+        Localiza campo (cache + uma única espera, timeout 3s).
 
         Args:
             timeout: Máximo (3s)
@@ -151,37 +167,34 @@ class DescriptionModule:
         if use_cache and self._cached_field:
             try:
                 self.driver.execute_script("arguments[0].scrollIntoView();", self._cached_field)
-                if self._wait_visible(By.ID, self._cached_field.id, timeout=0.5):
+                if self._cached_field.is_displayed():
                     self.log("✅ Cache hit")
                     return self._cached_field
-            except:
+            except Exception:
                 pass
 
-        deadline = time.time() + timeout
-        retries = 2  # Reduzido para eficiência
-
-        for retry in range(retries):
-            for by, value in DESCRIPTION_SELECTORS:
-                field = self._wait_visible(by, value, timeout=min(1, deadline - time.time()))  # 1s per selector
-                if field:
-                    self._cached_field = field
-                    label = value.split('[')[-1].rstrip(']') if '[' in value else value
-                    self.log(f"✅ Encontrado: {label}")
-                    return field
-
-            if retry < retries - 1:
-                self.log(f"🔄 Retry {retry+1}/2...")
-                time.sleep(0.5)  # Backoff curto
+        try:
+            field, index = self._waits.get(timeout).until(
+                lambda d: d.execute_script(_FIND_VISIBLE_FIELD_JS, _DESCRIPTION_SPECS)
+            )
+        except WebDriverException:
+            self.log(f"⚠️ Não encontrado após {timeout}s")
+            self._cached_field = None
+            return None
 
-        self.log("⚠️ Não encontrado após 2 retries")
-        self._cached_field = None
-        return None
+        self._cached_field = field
+        value = DESCRIPTION_SELECTORS[index][1]
+        label = value.split('[')[-1].rstrip(']') if '[' in value else value
+        self.log(f"✅ Encontrado: {label}")
+        return field
 
     # ===================== PREENCHIMENTO =====================
 
     def _fill_via_javascript(self, field, text: str) -> bool:
         """
         Preenche via JS simplificado (sem blur, dispatch composto).
+        O mesmo script devolve o tamanho do texto aplicado, confirmando o
+        preenchimento sem sleep nem round-trip extra.
 
         Args:
             field: Elemento
@@ -191,23 +204,90 @@ class DescriptionModule:
             True se sucesso
         """
         try:
-            self.driver.execute_script(
+            applied = self.driver.execute_script(
                 """
                 const el = arguments[0];
                 el.focus();
                 el.innerText = arguments[1];
                 el.dispatchEvent(new InputEvent('input', { bubbles: true, composed: true }));
                 el.dispatchEvent(new Event('change', { bubbles: true, composed: true }));
+                return (el.innerText || el.value || '').length;
                 """,
                 field,
                 text,
             )
+            if not applied:
+                self.log("⚠️ JS não aplicou o texto")
+                return False
             self.log(f"📝 JS preenchido ({len(text)} chars)")
             return True
         except Exception as e:
             self.log(f"⚠️ Falha JS: {e}")
             return False
 
+    def _fill_via_cdp(self, field, text: str) -> bool:
+        """
+        Insere o texto inteiro com um único Input.insertText (CDP), sem
+        sintetizar uma tecla por caractere.
+
+        Args:
+            field: Elemento
+            text: Texto
+
+        Returns:
+            True se sucesso (False se o driver não suporta CDP)
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        try:
+            # Foca e seleciona o conteúdo atual para o insertText substituí-lo
+            self.driver.execute_script(
+                """
+                const el = arguments[0];
+                el.focus();
+                if (typeof el.select === 'function') { el.select(); }
+                else { window.getSelection().selectAllChildren(el); }
+                """,
+                field,
+            )
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            self.log(f"📝 CDP preenchido ({len(text)} chars)")
+            return True
+        except WebDriverException as e:
+            self.log(f"⚠️ Falha CDP: {e}")
+            return False
+
+    def _fill_via_exec_command(self, field, text: str) -> bool:
+        """
+        Insere via document.execCommand('insertText'): dispara os eventos de
+        input nativos (tratados pelo editor do React) sem sintetizar teclas.
+
+        Args:
+            field: Elemento
+            text: Texto
+
+        Returns:
+            True se o navegador aceitou o comando
+        """
+        try:
+            inserted = self.driver.execute_script(
+                """
+                const el = arguments[0];
+                el.focus();
+                document.execCommand('selectAll', false, null);
+                return document.execCommand('insertText', false, arguments[1]);
+                """,
+                field,
+                text,
+            )
+        except WebDriverException as e:
+            self.log(f"⚠️ Falha execCommand: {e}")
+            return False
+        if not inserted:
+            return False
+        self.log(f"📝 execCommand preenchido ({len(text)} chars)")
+        return True
+
     def _fill_via_sendkeys(self, field, text: str) -> bool:
         """
         Fallback send_keys (clear rápido).
@@ -252,15 +332,21 @@ class DescriptionModule:
             self.log("⚠️ Campo não encontrado (continuando)")
             return True
 
-        # JS primeiro, fallback send_keys
+        # JS primeiro, depois CDP insertText e execCommand, fallback send_keys
         if self._fill_via_javascript(field, prepared_text):
             return True
 
+        if self._fill_via_cdp(field, prepared_text):
+            return True
+
+        if self._fill_via_exec_command(field, prepared_text):
+            return True
+
         if self._fill_via_sendkeys(field, prepared_text):
             return True
 
         if required:
-            self.log("❌ Falha ambos (required=True)")
+            self.log("❌ Falha em todos os métodos (required=True)")
             return False
         self.log("⚠️ Falha preenchimento (continuando)")
         return True
@@ -296,8 +382,8 @@ class DescriptionModule:
                     current_text = self.driver.execute_script("return arguments[0].innerText;", field).strip()
 
             # Partial: 80% len + top 3 words intersection (regex para velocidade)
-            expected_norm = re.sub(r'\s+', ' ', self._normalize_text(expected_text)).strip()
-            current_norm = re.sub(r'\s+', ' ', self._normalize_text(current_text)).strip()
+            expected_norm = _WHITESPACE_RE.sub(' ', self._normalize_text(expected_text)).strip()
+            current_norm = _WHITESPACE_RE.sub(' ', self._normalize_text(current_text)).strip()
             
             words_expected = expected_norm.split()[:3]  # Top 3 words
             if current_norm == expected_norm or (len(current_norm) >= 0.8 * len(expected_norm) and any(re.search(r'\b' + re.escape(w) + r'\b', current_norm) for w in words_expected)):
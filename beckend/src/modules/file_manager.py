@@ -4,6 +4,7 @@ Manipula, exclui ou move arquivos JSON e vídeos com segurança
 """
 import os
 import shutil
+import stat
 import json
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
@@ -240,13 +241,13 @@ class FileManagerModule:
         """
         lock_path = f"{file_path}.posting.lock"
 
-        if not os.path.exists(lock_path):
-            return True
-
+        # Remove direto: ausência vira FileNotFoundError, sem um exists() antes
         try:
             os.remove(lock_path)
             self.log(f"🔓 Lock removido: {os.path.basename(lock_path)}")
             return True
+        except FileNotFoundError:
+            return True
         except Exception as e:
             self.log(f"❌ Erro ao remover lock: {e}")
             return False
@@ -264,7 +265,10 @@ class FileManagerModule:
         """
         lock_path = f"{file_path}.posting.lock"
 
-        if not os.path.exists(lock_path):
+        # Um único stat responde existência e mtime
+        try:
+            lock_stat = os.stat(lock_path)
+        except OSError:
             return False
 
         # Se não precisa verificar idade, retorna True
@@ -273,7 +277,7 @@ class FileManagerModule:
 
         try:
             # Verifica idade do lock
-            lock_age = os.path.getmtime(lock_path)
+            lock_age = lock_stat.st_mtime
             current_time = datetime.now().timestamp()
             age_seconds = current_time - lock_age
 
@@ -442,13 +446,15 @@ class FileManagerModule:
         Returns:
             Tamanho em MB ou None se arquivo não existe
         """
-        if not os.path.isfile(file_path):
-            return None
-
+        # isfile + getsize num único stat
         try:
-            size_bytes = os.path.getsize(file_path)
-            size_mb = size_bytes / (1024 * 1024)
-            return round(size_mb, 2)
-        except Exception as e:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
             self.log(f"❌ Erro ao obter tamanho: {e}")
             return None
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return round(file_stat.st_size / (1024 * 1024), 2)
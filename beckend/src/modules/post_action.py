@@ -8,17 +8,14 @@ Módulo 4: Ação de Postagem (Versão Otimizada v2.0-fast)
 - Tratamento rápido de modais (Exit/TUX/Confirm).
 """
 
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Sequence
 import time
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    TimeoutException,
-    ElementClickInterceptedException,
-    NoSuchElementException,
-)
+from selenium.common.exceptions import ElementClickInterceptedException, StaleElementReferenceException
+
+from ._selenium_utils import IS_VISIBLE_JS, WaitPool
 
 __VERSION__ = "post_action v2.0-fast"
 
@@ -38,8 +35,76 @@ PUBLISH_CSS_SUPER = (
     "div[role='button'][data-e2e='action-button-post']"
 )
 
+# Primeiro botão visível e habilitado: procura no formulário de upload e depois no
+# document, num único round-trip (sem um is_displayed/is_enabled por candidato)
+_FIND_PUBLISH_JS = IS_VISIBLE_JS + """
+const findPublish = (css) => {
+    const form = document.querySelector('form,div[data-e2e="upload"]');
+    for (const root of (form ? [form, document] : [document])) {
+        for (const el of root.querySelectorAll(css)) {
+            if (el.disabled || el.getAttribute('aria-disabled') === 'true') continue;
+            if (isVisible(el)) return el;
+        }
+    }
+    return null;
+};
+"""
+PUBLISH_BUTTON_JS = _FIND_PUBLISH_JS + "return findPublish(arguments[0]);"
+
+# true/false se o PUBLISH_CASCADE_JS rodou neste documento; null se a página mudou
+POST_CLICKED_JS = "return window.__postClicked === undefined ? null : window.__postClicked;"
+
+# Cascata publicar -> confirmar num único execute_async_script: clica em Post e, no
+# próprio navegador, observa o DOM (MutationObserver) até o modal de confirmação
+# aparecer ou o prazo acabar. Retorna 0 (sem botão Post), 1 (publicou, sem modal)
+# ou 2 (publicou e confirmou). O fallback por texto só olha dentro de diálogos,
+# para não casar o próprio botão Post do formulário. window.__postClicked marca o
+# clique antes de ele acontecer: se o script falhar depois, não se clica de novo.
+PUBLISH_CASCADE_JS = _FIND_PUBLISH_JS + """
+const [css, confirmXpath, timeoutMs, done] = arguments;
+window.__postClicked = false;
+const publish = findPublish(css);
+if (!publish) { done(0); return; }
+publish.scrollIntoView({block: 'center', inline: 'center'});
+window.__postClicked = true;
+publish.click();
+const findConfirm = () => {
+    const snap = document.evaluate(confirmXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        const el = snap.snapshotItem(i);
+        if (!el.disabled && isVisible(el)) return el;
+    }
+    for (const btn of document.querySelectorAll("[role='dialog'] button, .TUXModal-overlay button")) {
+        if (!btn.disabled && /Post|Continue|Publicar/.test(btn.textContent) && isVisible(btn)) return btn;
+    }
+    return null;
+};
+let finished = false;
+let observer = null;
+let timer = null;
+const finish = (code) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(code);
+};
+const tryConfirm = () => {
+    try {
+        const btn = findConfirm();
+        if (btn) { btn.click(); finish(2); }
+    } catch (e) {
+        finish(1);
+    }
+};
+observer = new MutationObserver(tryConfirm);
+observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(() => finish(1), timeoutMs);
+tryConfirm();
+"""
+
 # Fallback XPaths (último recurso)
-PUBLISH_XPATHS = [
+PUBLISH_XPATHS = (
     "//button[@data-e2e='post_video_button' and not(@disabled)]",
     "//button[@data-e2e='post_button' and not(@disabled)]",
     "//button[@data-e2e='publish-button' and not(@disabled)]",
@@ -49,35 +114,68 @@ PUBLISH_XPATHS = [
     # Texto (fallback mesmo)
     "//button[contains(translate(normalize-space(.),'POST','post')) and not(@disabled)]",
     "//button[contains(translate(normalize-space(.),'PUBLICAR','publicar')) and not(@disabled)]",
-]
+)
 
-CONFIRM_XPATHS = [
+CONFIRM_XPATHS = (
     "//button[@data-e2e='confirm-button']",
     "//button[@data-e2e='post-confirm']",
     "//button[@data-testid='confirm-publish']",
     "//button[contains(., 'Post') or contains(., 'Continue') or contains(., 'Publicar')]",
-]
+)
 
-EXIT_XPATHS = [
+EXIT_XPATHS = (
     "//button[contains(translate(., 'CANCEL', 'cancel'), 'cancel')]",
     "//button[contains(translate(., 'CANCELAR', 'cancelar'), 'cancelar')]",
-]
+)
+EXIT_XPATH_UNION = " | ".join(EXIT_XPATHS)
+
+# Clica no primeiro botão Cancel visível da união; retorna se clicou
+EXIT_CANCEL_JS = """
+const snap = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < snap.snapshotLength; i++) {
+    const btn = snap.snapshotItem(i);
+    if (btn.disabled || !btn.getClientRects().length) continue;
+    btn.click();
+    return true;
+}
+return false;
+"""
 
-TUX_CLOSE_XPATHS = [
+TUX_CLOSE_XPATHS = (
     "//div[@class='TUXModal-overlay']//button[contains(@aria-label, 'Close')]",
     "//div[@class='TUXModal-overlay']//button[contains(@class, 'close')]",
     "//div[contains(@class, 'Modal')]//button[@aria-label='Close']",
     "//button[contains(@class, 'close') and contains(@class, 'modal')]",
-]
-
-SUCCESS_HINTS = [
+)
+# Todos os botões de fechar são clicados, então a ordem não importa: uma consulta só
+TUX_CLOSE_XPATH_UNION = " | ".join(TUX_CLOSE_XPATHS)
+
+# Marcadores data-e2e/data-testid do confirmar numa união para o PUBLISH_CASCADE_JS, que
+# percorre todos os nós e filtra visível/habilitado. O XPath por texto fica de fora, pois
+# também casaria o botão Post do formulário.
+CONFIRM_XPATH_UNION = " | ".join(CONFIRM_XPATHS[:-1])
+
+# Condições EC.any_of montadas uma vez por lista de XPaths (são stateless e reutilizáveis).
+# Uma condição por XPath: element_to_be_clickable só olha o primeiro nó encontrado, e numa
+# união ele seria o primeiro em ordem de documento, mesmo oculto ou desabilitado.
+_ANY_CLICKABLE = {
+    xpaths: EC.any_of(*(EC.element_to_be_clickable((By.XPATH, xp)) for xp in xpaths))
+    for xpaths in (PUBLISH_XPATHS, CONFIRM_XPATHS)
+}
+
+# Fallback XPath do botão Post: uma única espera cobrindo o antigo WAIT_FAST + WAIT_MED
+WAIT_PUBLISH_FALLBACK = WAIT_FAST + WAIT_MED
+# Prazo do modal de confirmação no PUBLISH_CASCADE_JS (mesmo da antiga cascata fast + med)
+WAIT_CONFIRM_MODAL = WAIT_FAST + WAIT_MED
+
+SUCCESS_HINTS = (
     "/video/",
     "tiktok.com/v/",
     "posted successfully",
     "video published",
     "vídeo publicado",
     "your video is live",
-]
+)
 
 
 class PostActionModule:
@@ -89,36 +187,32 @@ class PostActionModule:
     def __init__(self, driver, logger: Optional[Callable] = None):
         self.driver = driver
         self.log = logger if logger else print
+        # Modais re-renderizam durante a postagem: elemento stale só adia para o próximo poll
+        self._waits = WaitPool(
+            driver,
+            (WAIT_FAST, WAIT_MED, WAIT_PUBLISH_FALLBACK),
+            POLL,
+            ignored_exceptions=(StaleElementReferenceException,),
+        )
 
     # ============ Utils rápidos ============
 
     def _now(self) -> float:
         return time.perf_counter()
 
-    def _wait_any_xpath(self, xpaths: List[str], timeout: float) -> Optional[object]:
-        """Espera o primeiro elemento de uma lista de XPaths ficar clicável."""
-        end = self._now() + timeout
-        while self._now() < end:
-            for xp in xpaths:
-                try:
-                    el = WebDriverWait(self.driver, 0.5, POLL).until(
-                        EC.element_to_be_clickable((By.XPATH, xp))
-                    )
-                    if el:
-                        return el
-                except Exception:
-                    continue
-        return None
-
-    def _js_query(self, root, css: str):
-        """querySelectorAll via JS a partir de root (document ou um container)."""
+    def _wait_any_xpath(self, xpaths: Sequence[str], timeout: float) -> Optional[object]:
+        """
+        Espera o primeiro elemento de uma lista de XPaths ficar clicável.
+        Um único loop de polling avalia todos os XPaths (na ordem) a cada ciclo,
+        em vez de esperar XPath por XPath.
+        """
+        condition = _ANY_CLICKABLE.get(xpaths)
+        if condition is None:
+            condition = EC.any_of(*(EC.element_to_be_clickable((By.XPATH, xp)) for xp in xpaths))
         try:
-            return self.driver.execute_script(
-                "return Array.from(arguments[0].querySelectorAll(arguments[1]));",
-                root, css
-            )
+            return self._waits.get(timeout).until(condition)
         except Exception:
-            return []
+            return None
 
     def _scroll_into_view_center(self, el):
         try:
@@ -152,32 +246,33 @@ class PostActionModule:
 
     def close_exit_modal(self) -> bool:
         """Fecha modal 'Are you sure you want to exit?' clicando em Cancel (fast-path)."""
-        for xp in EXIT_XPATHS:
-            try:
-                btn = WebDriverWait(self.driver, WAIT_FAST, POLL).until(
-                    EC.element_to_be_clickable((By.XPATH, xp))
-                )
-                if btn and self._click_element(btn):
-                    self.log("🚪 Modal 'exit' fechado (Cancel)")
-                    # Espera curta para sumir
-                    try:
-                        WebDriverWait(self.driver, WAIT_FAST, POLL).until_not(
-                            EC.presence_of_element_located((By.XPATH, xp))
-                        )
-                    except Exception:
-                        pass
-                    return True
-            except Exception:
-                continue
-        return False
+        # Detecta e clica num único script: sem modal, retorna na hora (antes: espera de WAIT_FAST)
+        try:
+            clicked = self.driver.execute_script(EXIT_CANCEL_JS, EXIT_XPATH_UNION)
+        except Exception:
+            return False
+        if not clicked:
+            return False
+        self.log("🚪 Modal 'exit' fechado (Cancel)")
+        # Espera curta para sumir
+        try:
+            self._waits.get(WAIT_FAST).until_not(
+                EC.presence_of_element_located((By.XPATH, EXIT_XPATH_UNION))
+            )
+        except Exception:
+            pass
+        return True
 
     def close_blocking_modals(self) -> bool:
         """Fecha modais TUX que podem bloquear interação."""
         closed = False
-        for xp in TUX_CLOSE_XPATHS:
+        try:
+            buttons = self.driver.find_elements(By.XPATH, TUX_CLOSE_XPATH_UNION)
+        except Exception:
+            buttons = []
+        for btn in buttons:
             try:
-                btn = self.driver.find_element(By.XPATH, xp)
-                if btn and btn.is_displayed() and self._click_element(btn):
+                if btn.is_displayed() and self._click_element(btn):
                     closed = True
             except Exception:
                 continue
@@ -203,7 +298,7 @@ class PostActionModule:
                 self.log("✅ Confirmação resolvida")
                 # Espera overlay sumir rapidamente
                 try:
-                    WebDriverWait(self.driver, WAIT_MED, POLL).until_not(
+                    self._waits.get(WAIT_MED).until_not(
                         EC.presence_of_element_located((By.CLASS_NAME, "TUXModal-overlay"))
                     )
                 except Exception:
@@ -223,45 +318,71 @@ class PostActionModule:
         Localiza rapidamente o botão Post:
         1) dentro do formulário/container de upload,
         2) no document,
-        3) fallback XPath com backoff curto.
+        3) fallback XPath (uma única espera).
         """
+        # 1) + 2) formulário e depois document, filtrando visível/habilitado no próprio JS
         try:
-            doc = self.driver.find_element(By.TAG_NAME, "body")
+            btn = self.driver.execute_script(PUBLISH_BUTTON_JS, PUBLISH_CSS_SUPER)
+            if btn:
+                return btn
         except Exception:
-            return None
+            pass
 
-        # 1) tenta dentro do formulário/container principal
-        candidates = []
+        # 3) fallback XPath (um único polling, sem reiniciar a espera)
+        return self._wait_any_xpath(PUBLISH_XPATHS, timeout=WAIT_PUBLISH_FALLBACK)
+
+    def publish_and_confirm(self) -> bool:
+        """
+        Clica em Post e resolve o modal de confirmação num único round-trip
+        (PUBLISH_CASCADE_JS). Se o CSS não achar o botão, cai para
+        click_publish_button + handle_confirmation_dialog. Se o script falhar
+        depois de clicar (timeout, navegação), não clica de novo.
+        """
+        start = self._now()
         try:
-            form = self.driver.execute_script(
-                "return document.querySelector('form,div[data-e2e=\"upload\"]') || document.body;"
+            status = self.driver.execute_async_script(
+                PUBLISH_CASCADE_JS, PUBLISH_CSS_SUPER, CONFIRM_XPATH_UNION, int(WAIT_CONFIRM_MODAL * 1000)
             )
-            candidates = self._js_query(form, PUBLISH_CSS_SUPER)
-        except Exception:
-            candidates = []
-
-        # 2) tenta no documento todo
-        if not candidates:
-            candidates = self._js_query(doc, PUBLISH_CSS_SUPER)
+        except Exception as e:
+            if self._post_clicked_after_error():
+                self.log(f"⚠️ Script de publicação falhou após o clique ({type(e).__name__}); sem novo clique")
+                self.handle_confirmation_dialog()
+                return True
+            status = None
 
-        # 3) fallback XPath com backoff
-        if not candidates:
-            btn = self._wait_any_xpath(PUBLISH_XPATHS, timeout=WAIT_FAST)
-            if btn:
-                return btn
-            btn = self._wait_any_xpath(PUBLISH_XPATHS, timeout=WAIT_MED)
-            if btn:
-                return btn
-            return None
+        if not status:
+            if not self.click_publish_button():
+                return False
+            self.handle_confirmation_dialog()
+            return True
 
-        # filtra visíveis/habilitados
-        for el in candidates:
+        self.log(f"🚀 Botão de publicar clicado em {(self._now()-start):.2f}s")
+        if status == 2:
+            self.log("✅ Confirmação resolvida")
             try:
-                if el.is_displayed() and el.is_enabled():
-                    return el
+                self._waits.get(WAIT_MED).until_not(
+                    EC.presence_of_element_located((By.CLASS_NAME, "TUXModal-overlay"))
+                )
             except Exception:
-                continue
-        return None
+                pass
+        else:
+            # Sem modal de confirmação: só os fechamentos rápidos, sem nova espera
+            self.close_exit_modal()
+            self.close_blocking_modals()
+        return True
+
+    def _post_clicked_after_error(self) -> bool:
+        """
+        O PUBLISH_CASCADE_JS chegou a clicar em Post antes de falhar? Lê a flag do
+        script; se o documento mudou (flag ausente), o botão Post sumido indica clique.
+        """
+        try:
+            clicked = self.driver.execute_script(POST_CLICKED_JS)
+        except Exception:
+            clicked = None
+        if clicked is not None:
+            return bool(clicked)
+        return not self.publish_button_exists()
 
     def click_publish_button(self) -> bool:
         """Localiza e clica em 'Post' de forma agressivamente rápida."""
@@ -308,11 +429,11 @@ class PostActionModule:
     ) -> bool:
         self.log("🚀 Executando ação de postagem (fast path)...")
 
-        if not self.click_publish_button():
-            return False
-
         if handle_modals:
-            self.handle_confirmation_dialog()
+            if not self.publish_and_confirm():
+                return False
+        elif not self.click_publish_button():
+            return False
 
         # retry curtíssimo se ainda estiver na tela de upload
         try:
@@ -338,7 +459,6 @@ class PostActionModule:
 
     def publish_button_exists(self) -> bool:
         try:
-            found = self._js_query(self.driver.execute_script("return document;"), PUBLISH_CSS_SUPER)
-            return any(el.is_displayed() for el in found)
+            return self.driver.execute_script(PUBLISH_BUTTON_JS, PUBLISH_CSS_SUPER) is not None
         except Exception:
             return False
@@ -16,8 +16,19 @@ from enum import Enum
 from typing import Optional, Callable, Tuple, List, Dict
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from ._selenium_utils import (
+    IS_VISIBLE_JS,
+    STATUS_TEXTS_FN_JS,
+    STATUS_TEXTS_JS,
+    WaitPool,
+    write_bytes_async,
+)
 
 # ===================== Configs =====================
 
@@ -27,6 +38,24 @@ PROBING_THRESHOLD = 0.7
 PROBING_MAX_WAIT = 12
 EARLY_EXIT_THRESHOLD = 50
 FORCE_PROBE_AFTER = 60  # <- NOVO: força probing após 60s
+POLL_MAX_INTERVAL = 3.0  # backoff do poll: 1s -> 1.5s -> 2.25s -> 3s (reinicia quando o progresso muda)
+STALE_RETRIES = 2  # leituras por elemento antes de desistir de um StaleElementReference
+
+# URL + visibilidade do botão de postar numa única chamada ao navegador
+_PAGE_STATE_FN_JS = """
+const pageState = () => {
+    const buttons = document.querySelectorAll("button[data-e2e='post_video_button']");
+    return [location.href, Array.prototype.some.call(buttons, isVisible)];
+};
+"""
+PAGE_STATE_JS = IS_VISIBLE_JS + _PAGE_STATE_FN_JS + "return pageState();"
+
+# Poll de confirmação fundido: textos de status + URL + botão num único execute_script
+# -> [texts, bodyText, url, buttonVisible]
+CONFIRM_STATE_JS = (
+    IS_VISIBLE_JS + STATUS_TEXTS_FN_JS + _PAGE_STATE_FN_JS
+    + "return statusTexts(arguments[0]).concat(pageState());"
+)
 
 SUCCESS_URL_FRAGMENTS = (
     "/post",
@@ -42,6 +71,9 @@ SUCCESS_URL_FRAGMENTS = (
     "published",
     "success",
 )
+# Uma varredura da URL por poll em vez de um `in` por fragmento. Mantém a semântica de
+# substring (fragmentos como 'success' não têm barra para ancorar)
+_SUCCESS_URL_RE = re.compile("|".join(re.escape(f) for f in SUCCESS_URL_FRAGMENTS))
 
 HARD_SUCCESS_KEYWORDS = (
     "video posted successfully",
@@ -97,6 +129,27 @@ PROGRESS_PATTERNS = (
     re.compile(r"\bhours?\s+(?:left|remaining)\b"),
 )
 
+
+def _fold_keyword(keyword: str) -> str:
+    """Mesma dobra de _normalize_text (NFKD, ASCII, minúsculas) aplicada à keyword."""
+    folded = unicodedata.normalize("NFKD", keyword).encode("ascii", "ignore").decode()
+    return " ".join(folded.casefold().split())
+
+
+def _keyword_regex(keywords) -> "re.Pattern[str]":
+    """
+    Une as keywords numa única alternância: uma varredura em C por texto.
+    As keywords são dobradas uma vez aqui, como o texto normalizado que será
+    varrido ('vídeo publicado' vira 'video publicado' e volta a casar).
+    """
+    folded = dict.fromkeys(_fold_keyword(k) for k in keywords)
+    return re.compile("|".join(re.escape(k) for k in folded if k))
+
+
+_HARD_SUCCESS_RE = _keyword_regex(HARD_SUCCESS_KEYWORDS)
+_SUBMITTED_RE = _keyword_regex(SUBMITTED_KEYWORDS)
+_PROGRESS_TOKENS_RE = _keyword_regex(PROGRESS_TOKENS)
+
 STATUS_TEXT_SELECTORS = (
     "//*[@role='status' or @role='alert' or @aria-live]",
     "//*[contains(@data-e2e, 'result')]",
@@ -112,6 +165,9 @@ STATUS_TEXT_SELECTORS = (
     "//div[@role='dialog']//*[@data-e2e='success-message']",
 )
 
+# Mutações do DOM durante a publicação: o poll seguinte relê tudo, não é erro
+TRANSIENT_DOM_EXCEPTIONS = (StaleElementReferenceException, NoSuchElementException)
+
 LOADING_SELECTORS = (
     ".upload-progress",
     ".processing-spinner",
@@ -119,6 +175,10 @@ LOADING_SELECTORS = (
     "[class*='loading']",
     "[class*='spinner']",
 )
+# Lista de seletores CSS: um find_elements por poll em vez de um por seletor
+LOADING_CSS = ",".join(LOADING_SELECTORS)
+WAIT_LOADING = 10
+
 
 # ===================== Estados & Resultado =====================
 
@@ -161,6 +221,11 @@ class PostConfirmationModule:
         self._cached_signals: Optional[ConfirmationSignals] = None
         self._expected_title: Optional[str] = None
         self._username: Optional[str] = None
+        # DOM muda o tempo todo durante a publicação: stale/no-such não abortam a espera
+        self._waits = WaitPool(driver, (WAIT_LOADING,), ignored_exceptions=TRANSIENT_DOM_EXCEPTIONS)
+        # Última leitura de textos e sua classificação (a página costuma repetir entre polls)
+        self._last_texts_key: Optional[Tuple[Tuple[str, ...], str]] = None
+        self._last_classification: Optional[Tuple[List[str], List[str], Optional[str], Optional[str], float]] = None
 
     # Contexto (opcional)
     def set_context(self, expected_title: Optional[str] = None, username: Optional[str] = None):
@@ -183,7 +248,7 @@ class PostConfirmationModule:
     def _is_progress_text(norm_text: str) -> Tuple[bool, float]:
         if not norm_text:
             return False, 0.0
-        if any(token in norm_text for token in PROGRESS_TOKENS):
+        if _PROGRESS_TOKENS_RE.search(norm_text):
             return True, 0.0
         for pattern in PROGRESS_PATTERNS:
             match = pattern.search(norm_text)
@@ -205,21 +270,22 @@ class PostConfirmationModule:
             return ""
 
     # Coleta
-    def _scan_status_messages(self, refresh: bool = False) -> Tuple[List[str], List[str], Optional[str], Optional[str], float]:
-        if not refresh and self._cached_signals:
-            return (
-                self._cached_signals.progress_snippets,
-                self._cached_signals.success_snippets,
-                self._cached_signals.hard_success_text,
-                self._cached_signals.submitted_text,
-                self._cached_signals.progress_percentage,
-            )
-
+    def _switch_to_default_content(self) -> None:
         try:
             self.driver.switch_to.default_content()
         except Exception:
             pass
 
+    def _classify_status_texts(self, texts, body_text: str) -> Tuple[List[str], List[str], Optional[str], Optional[str], float]:
+        """
+        Classifica os textos lidos da página em progresso / sucesso / submitted.
+        Se os textos forem idênticos aos do poll anterior, reaproveita o resultado
+        (evita normalizar o body inteiro de novo).
+        """
+        texts_key = (tuple(texts or ()), body_text or "")
+        if texts_key == self._last_texts_key and self._last_classification is not None:
+            return self._last_classification
+
         progress_snippets: List[str] = []
         success_snippets: List[str] = []
         hard_success_text: Optional[str] = None
@@ -227,11 +293,6 @@ class PostConfirmationModule:
         progress_pct_sum = 0.0
         pct_count = 0
 
-        try:
-            WebDriverWait(self.driver, 1).until(lambda d: len(d.find_elements(By.XPATH, "//body")) > 0)
-        except TimeoutException:
-            pass
-
         def _classify_text(raw: str):
             nonlocal hard_success_text, submitted_text, progress_pct_sum, pct_count
             text = (raw or "").strip()
@@ -242,11 +303,11 @@ class PostConfirmationModule:
                 return
             snippet = self._shorten_text(text)
 
-            if any(k in norm for k in HARD_SUCCESS_KEYWORDS):
+            if _HARD_SUCCESS_RE.search(norm):
                 success_snippets.append(snippet)
                 if hard_success_text is None:
                     hard_success_text = snippet
-            elif any(k in norm for k in SUBMITTED_KEYWORDS):
+            elif _SUBMITTED_RE.search(norm):
                 success_snippets.append(snippet)
                 if submitted_text is None:
                     submitted_text = snippet
@@ -258,25 +319,35 @@ class PostConfirmationModule:
                         progress_pct_sum += pct
                         pct_count += 1
 
-        for selector in STATUS_TEXT_SELECTORS:
-            try:
-                for el in self.driver.find_elements(By.XPATH, selector):
-                    try:
-                        _classify_text(el.text)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        for text in texts or ():
+            _classify_text(text)
+        _classify_text(body_text)
+
+        avg_pct = (progress_pct_sum / pct_count) if pct_count > 0 else 0.0
+        self._last_texts_key = texts_key
+        self._last_classification = (progress_snippets, success_snippets, hard_success_text, submitted_text, avg_pct)
+        return self._last_classification
+
+    def _scan_status_messages(self, refresh: bool = False, switch: bool = True) -> Tuple[List[str], List[str], Optional[str], Optional[str], float]:
+        if not refresh and self._cached_signals:
+            return (
+                self._cached_signals.progress_snippets,
+                self._cached_signals.success_snippets,
+                self._cached_signals.hard_success_text,
+                self._cached_signals.submitted_text,
+                self._cached_signals.progress_percentage,
+            )
+
+        if switch:
+            self._switch_to_default_content()
 
         try:
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
-            _classify_text(body_text)
+            texts, body_text = self.driver.execute_script(STATUS_TEXTS_JS, STATUS_TEXT_SELECTORS)
         except Exception:
-            pass
-
-        avg_pct = (progress_pct_sum / pct_count) if pct_count > 0 else 0.0
+            texts, body_text = (), ""
+        progress_snippets, success_snippets, hard_success_text, submitted_text, avg_pct = (
+            self._classify_status_texts(texts, body_text)
+        )
 
         if not refresh:
             self._cached_signals = ConfirmationSignals(
@@ -291,10 +362,12 @@ class PostConfirmationModule:
 
     # Checks
     def check_url_changed(self) -> Tuple[bool, bool, bool]:
-        url = self._now_url()
+        return self._url_signals(self._now_url())
+
+    def _url_signals(self, url: str) -> Tuple[bool, bool, bool]:
         left_upload = "upload" not in url
         video_url_detected = "/video/" in url or "tiktok.com/v/" in url
-        url_changed = left_upload or any(f in url for f in SUCCESS_URL_FRAGMENTS)
+        url_changed = left_upload or _SUCCESS_URL_RE.search(url) is not None
         if left_upload:
             self.log(f"✅ Saiu da página de upload: {url}")
         if video_url_detected:
@@ -302,23 +375,75 @@ class PostConfirmationModule:
         return url_changed, left_upload, video_url_detected
 
     def check_publish_button_disappeared(self) -> bool:
+        self._switch_to_default_content()
+        # Botão re-renderizado entre o find e o is_displayed fica stale: busca de novo
+        # (uma vez) em vez de desistir da leitura
+        for _ in range(STALE_RETRIES):
+            try:
+                buttons = self.driver.find_elements(By.XPATH, "//button[@data-e2e='post_video_button']")
+                visible = any(btn.is_displayed() for btn in buttons if btn)
+            except StaleElementReferenceException:
+                continue
+            except Exception:
+                return False
+            if not visible:
+                self.log("✅ Botão 'Publicar' ausente")
+                return True
+            return False
+        return False
+
+    def _probe_page_state(self, switch: bool = True) -> Tuple[str, bool]:
+        """
+        Lê URL atual e se o botão de postar sumiu num único execute_script
+        (em vez de current_url + find_elements + is_displayed por botão).
+        Cai para os checks individuais se o JS falhar.
+        """
+        if switch:
+            self._switch_to_default_content()
         try:
-            self.driver.switch_to.default_content()
+            url, button_visible = self.driver.execute_script(PAGE_STATE_JS)
+            url = (url or "").lower()
         except Exception:
-            pass
+            return self._now_url(), self.check_publish_button_disappeared()
+        if not button_visible:
+            self.log("✅ Botão 'Publicar' ausente")
+        return url, not button_visible
+
+    def _collect_signals(self) -> ConfirmationSignals:
+        # Um switch_to + um execute_script por poll (CONFIRM_STATE_JS); se o script
+        # fundido falhar, cai para as leituras separadas
+        self._switch_to_default_content()
         try:
-            buttons = self.driver.find_elements(By.XPATH, "//button[@data-e2e='post_video_button']")
-            if not any(btn.is_displayed() for btn in buttons if btn):
-                self.log("✅ Botão 'Publicar' ausente")
-                return True
+            texts, body_text, url, button_visible = self.driver.execute_script(
+                CONFIRM_STATE_JS, STATUS_TEXT_SELECTORS
+            )
         except Exception:
-            pass
-        return False
+            progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._scan_status_messages(refresh=True, switch=False)
+            url, button_gone = self._probe_page_state(switch=False)
+        else:
+            progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._classify_status_texts(texts, body_text)
+            url = (url or "").lower()
+            button_gone = not button_visible
+            if button_gone:
+                self.log("✅ Botão 'Publicar' ausente")
+        url_changed, left_upload, video_url_detected = self._url_signals(url)
+        return ConfirmationSignals(
+            url_changed=url_changed,
+            left_upload=left_upload,
+            video_url_detected=video_url_detected,
+            publish_button_disappeared=button_gone,
+            hard_success_text=hard_text,
+            submitted_text=submitted_text,
+            progress_snippets=progress_snips,
+            success_snippets=success_snips,
+            current_url=url,
+            progress_percentage=avg_pct,
+        )
 
-    def wait_for_loading_to_finish(self, timeout: int = 10) -> bool:
+    def wait_for_loading_to_finish(self, timeout: int = WAIT_LOADING) -> bool:
         try:
-            WebDriverWait(self.driver, timeout).until_not(
-                lambda d: any(d.find_elements(By.CSS_SELECTOR, sel) for sel in LOADING_SELECTORS)
+            self._waits.get(timeout).until_not(
+                lambda d: d.find_elements(By.CSS_SELECTOR, LOADING_CSS)
             )
             self.log("✅ Loading sumiu")
             return True
@@ -334,9 +459,9 @@ class PostConfirmationModule:
             self.log("🔎 Probing Creator Center (tab=posted)...")
             self.driver.get(target)
 
-            end = time.time() + max_wait
+            end = time.monotonic() + max_wait
             found_any = False
-            while time.time() < end:
+            while time.monotonic() < end:
                 try:
                     links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/video/')]")
                     if links:
@@ -394,37 +519,27 @@ class PostConfirmationModule:
         if quick_check:
             return self._quick_confirm(strict=strict)
 
-        start = time.time()
+        start = time.monotonic()
         deadline = start + timeout
         probe_done_pct = False
         probe_done_force = False
         last_progress = ""
+        poll_interval = POLL_INTERVAL
 
         self.log(f"⏳ Aguardando confirmação (timeout: {timeout}s, strict={strict})...")
 
         while True:
-            now = time.time()
+            now = time.monotonic()
             if now >= deadline:
                 break
             remaining = deadline - now
 
             try:
-                progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._scan_status_messages(refresh=True)
-                url_changed, left_upload, video_url_detected = self.check_url_changed()
-                button_gone = self.check_publish_button_disappeared()
-
-                signals = ConfirmationSignals(
-                    url_changed=url_changed,
-                    left_upload=left_upload,
-                    video_url_detected=video_url_detected,
-                    publish_button_disappeared=button_gone,
-                    hard_success_text=hard_text,
-                    submitted_text=submitted_text,
-                    progress_snippets=progress_snips,
-                    success_snippets=success_snips,
-                    current_url=self._now_url(),
-                    progress_percentage=avg_pct,
-                )
+                signals = self._collect_signals()
+                progress_snips = signals.progress_snippets
+                avg_pct = signals.progress_percentage
+                left_upload = signals.left_upload
+                button_gone = signals.publish_button_disappeared
 
                 result = self._decide_status(signals, strict=strict)
                 if result.is_published():
@@ -458,38 +573,28 @@ class PostConfirmationModule:
                     if summary != last_progress:
                         self.log(f"⏳ Aguardando: {summary} ({avg_pct:.0f}%)")
                         last_progress = summary
+                        # Estado mudou: o próximo sinal tende a vir logo, volta ao poll curto
+                        poll_interval = POLL_INTERVAL
 
-            except StaleElementReferenceException:
-                self.log("🔄 Stale – retrying...")
+            except TRANSIENT_DOM_EXCEPTIONS:
+                self.log("🔄 DOM mudou durante o poll – retrying...")
             except Exception as e:
                 self.log(f"⚠️ Erro aguardando: {e}")
 
-            time.sleep(min(POLL_INTERVAL, remaining))
+            time.sleep(min(poll_interval, remaining))
+            # Publicação costuma levar >10s; espaça os polls gradualmente
+            poll_interval = min(poll_interval * 1.5, POLL_MAX_INTERVAL)
 
         # Timeout: snapshot final
         try:
             screenshot_path = f"/tmp/tiktok_confirmation_timeout_{int(time.time())}.png"
-            self.driver.save_screenshot(screenshot_path)
-            self.log(f"📸 Screenshot timeout: {screenshot_path}")
+            # Só a captura precisa da thread do driver; a gravação em disco vai para segundo plano
+            write_bytes_async(screenshot_path, self.driver.get_screenshot_as_png(), self.log, "Screenshot timeout")
         except Exception:
             pass
 
         # Re-scan final
-        progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._scan_status_messages(refresh=True)
-        url_changed, left_upload, video_url_detected = self.check_url_changed()
-        button_gone = self.check_publish_button_disappeared()
-        signals = ConfirmationSignals(
-            url_changed=url_changed,
-            left_upload=left_upload,
-            video_url_detected=video_url_detected,
-            publish_button_disappeared=button_gone,
-            hard_success_text=hard_text,
-            submitted_text=submitted_text,
-            progress_snippets=progress_snips,
-            success_snippets=success_snips,
-            current_url=self._now_url(),
-            progress_percentage=avg_pct,
-        )
+        signals = self._collect_signals()
         result = self._decide_status(signals, strict=strict)
 
         if result.is_published():
@@ -501,25 +606,37 @@ class PostConfirmationModule:
 
         return result
 
+    def page_state(self) -> Optional[Dict[str, object]]:
+        """
+        URL e botão Post num único execute_script (PAGE_STATE_JS). Retorna
+        {"url", "on_upload", "confirmed"} ou None se o script falhar.
+        """
+        try:
+            url, button_visible = self.driver.execute_script(PAGE_STATE_JS)
+        except Exception:
+            return None
+        url = (url or "").lower()
+        on_upload = "upload" in url
+        return {
+            "url": url,
+            "on_upload": on_upload,
+            "confirmed": not on_upload or "/video/" in url or not button_visible,
+        }
+
+    def quick_check(self) -> bool:
+        """
+        Sinal rápido: saiu da página de upload, URL de vídeo ou botão Post sumiu.
+        Não decide status; serve para encerrar esperas curtas antes do
+        confirm_posted estrito.
+        """
+        state = self.page_state()
+        return bool(state and state["confirmed"])
+
     def _quick_confirm(self, strict: bool) -> ConfirmationResult:
         if self._cached_signals:
             s = self._cached_signals
         else:
-            progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._scan_status_messages(refresh=True)
-            url_changed, left_upload, video_url_detected = self.check_url_changed()
-            button_gone = self.check_publish_button_disappeared()
-            s = ConfirmationSignals(
-                url_changed=url_changed,
-                left_upload=left_upload,
-                video_url_detected=video_url_detected,
-                publish_button_disappeared=button_gone,
-                hard_success_text=hard_text,
-                submitted_text=submitted_text,
-                progress_snippets=progress_snips,
-                success_snippets=success_snips,
-                current_url=self._now_url(),
-                progress_percentage=avg_pct,
-            )
+            s = self._collect_signals()
             self._cached_signals = s
         return self._decide_status(s, strict=strict)
 
@@ -527,21 +644,7 @@ class PostConfirmationModule:
         if self._cached_signals:
             s = self._cached_signals
         else:
-            progress_snips, success_snips, hard_text, submitted_text, avg_pct = self._scan_status_messages(refresh=True)
-            url_changed, left_upload, video_url_detected = self.check_url_changed()
-            button_gone = self.check_publish_button_disappeared()
-            s = ConfirmationSignals(
-                url_changed=url_changed,
-                left_upload=left_upload,
-                video_url_detected=video_url_detected,
-                publish_button_disappeared=button_gone,
-                hard_success_text=hard_text,
-                submitted_text=submitted_text,
-                progress_snippets=progress_snips,
-                success_snippets=success_snips,
-                current_url=self._now_url(),
-                progress_percentage=avg_pct,
-            )
+            s = self._collect_signals()
             self._cached_signals = s
         return {
             "url_changed": s.url_changed,
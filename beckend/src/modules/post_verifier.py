@@ -15,6 +15,30 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 
 TARGET_URL = "https://www.tiktok.com/tiktokstudio?tab=posted"
 
+CANDIDATE_XPATHS = (
+    "//a[contains(@href, '/video/')]",
+    "//*[@data-e2e='post-list']//*[self::a or self::div]",
+    "//*[contains(@class,'post-card') or contains(@class,'video-item')]",
+)
+
+# Textos dos candidatos (na ordem dos XPaths, até arguments[1] itens) num único
+# round-trip, em vez de find_elements + um .text por cartão
+CANDIDATE_TEXTS_JS = """
+const [xpaths, maxItems] = arguments;
+const texts = [];
+for (const xp of xpaths) {
+    const snap = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        const el = snap.snapshotItem(i);
+        if (!el.getClientRects().length) continue;
+        const text = (el.innerText || '').trim();
+        if (text) texts.push(text);
+        if (texts.length >= maxItems) return texts;
+    }
+}
+return texts;
+"""
+
 
 class PostPublishVerifier:
     """
@@ -25,6 +49,8 @@ class PostPublishVerifier:
     def __init__(self, driver, logger: Optional[Callable[[str], None]] = None):
         self.driver = driver
         self.log = logger if logger else print
+        # Reaproveitada a cada tentativa de abrir o Creator Center
+        self._page_wait = WebDriverWait(driver, 5)
 
     # ===== Utils =====
     @staticmethod
@@ -56,13 +82,14 @@ class PostPublishVerifier:
         return sum(1 for tok in signature if tok in candidate_tokens)
 
     def _collect_candidate_texts(self, max_items: int = 8) -> List[str]:
+        try:
+            return list(self.driver.execute_script(CANDIDATE_TEXTS_JS, CANDIDATE_XPATHS, max_items) or [])
+        except WebDriverException:
+            pass
+
+        # Fallback: um .text por elemento
         texts: List[str] = []
-        selectors = [
-            "//a[contains(@href, '/video/')]",
-            "//*[@data-e2e='post-list']//*[self::a or self::div]",
-            "//*[contains(@class,'post-card') or contains(@class,'video-item')]",
-        ]
-        for selector in selectors:
+        for selector in CANDIDATE_XPATHS:
             try:
                 elements = self.driver.find_elements(By.XPATH, selector)
             except WebDriverException:
@@ -91,13 +118,13 @@ class PostPublishVerifier:
             self.log("ℹ️ Sem assinatura de verificação – pulando verificador externo.")
             return False
 
-        deadline = time.time() + max(10, timeout)
+        deadline = time.monotonic() + max(10, timeout)
         attempt = 0
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             attempt += 1
             try:
                 self.driver.get(TARGET_URL)
-                WebDriverWait(self.driver, 5).until(
+                self._page_wait.until(
                     lambda d: len(d.find_elements(By.XPATH, "//body")) > 0
                 )
             except TimeoutException:
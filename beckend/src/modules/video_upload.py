@@ -4,6 +4,7 @@ Responsável por enviar o vídeo e validar formato, tamanho e integridade
 Fixes: Partial match keywords, stall para 90%+, EC para UI pós-upload ("description", "hashtags").
 """
 import os
+import stat
 import time
 import re
 import unicodedata
@@ -17,18 +18,22 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
-    StaleElementReferenceException,
+    WebDriverException,
 )
 
+from ._selenium_utils import STATUS_TEXTS_JS, WaitPool, write_bytes_async
+
 # Constantes
 WAIT_SHORT = 5
 WAIT_MED = 15
 WAIT_LONG = 30
+MIN_VIDEO_SIZE_BYTES = 200 * 1024
 
 STUDIO_URL = "https://www.tiktok.com/tiktokstudio/upload?from=creator_center"
 CLASSIC_URL = "https://www.tiktok.com/upload"
+UPLOAD_PAGE_URL_FRAGMENTS = ("tiktokstudio/upload", "creator-center/upload", "tiktok.com/upload")
 
-FILE_INPUT_SELECTORS = [
+FILE_INPUT_SELECTORS = (
     (By.CSS_SELECTOR, "input[type='file']"),
     (By.CSS_SELECTOR, "input[accept*='video']"),
     (By.CSS_SELECTOR, "input[name='file']"),
@@ -42,9 +47,21 @@ FILE_INPUT_SELECTORS = [
     (By.XPATH, "//input[@type='file']"),
     (By.XPATH, "//input[contains(@accept, 'video')]"),
     (By.XPATH, "//input[@name='file']"),
-]
+)
 
-STATUS_TEXT_SELECTORS = [
+# Versão CSS dos seletores acima (os XPaths são equivalentes aos três primeiros)
+FILE_INPUT_CSS = tuple(value for by, value in FILE_INPUT_SELECTORS if by == By.CSS_SELECTOR)
+
+# Retorna o índice do primeiro seletor com match (ou null)
+_FIND_FIRST_SELECTOR_JS = """
+const selectors = arguments[0];
+for (let i = 0; i < selectors.length; i++) {
+    if (document.querySelector(selectors[i])) return i;
+}
+return null;
+"""
+
+STATUS_TEXT_SELECTORS = (
     (By.XPATH, "//*[@role='status' or @role='alert' or @aria-live]"),
     (By.XPATH, "//*[contains(@data-e2e, 'result')]"),
     (By.XPATH, "//*[contains(@data-e2e, 'success')]"),
@@ -54,16 +71,31 @@ STATUS_TEXT_SELECTORS = [
     (By.XPATH, "//*[contains(@class, 'result')]"),
     (By.XPATH, "//*[contains(@class, 'success')]"),
     (By.XPATH, "//*[contains(@class, 'progress')]"),
-]
+)
+
+STATUS_TEXT_XPATHS = tuple(value for _by, value in STATUS_TEXT_SELECTORS)
+
+# Intervalo entre polls de progresso: volta ao mínimo quando o status muda,
+# dobra a cada poll sem mudança até o máximo
+PROGRESS_POLL_MIN = 0.5
+PROGRESS_POLL_MAX = 8.0
+
+# Preview do vídeo pronto: um único seletor CSS (uma consulta por poll em vez de três)
+PREVIEW_READY_CSS = "video, canvas, [class*='preview']"
 
 # Novo: Seletores para UI pós-upload (do screenshot)
-POST_UPLOAD_SELECTORS = [
+POST_UPLOAD_SELECTORS = (
     (By.CSS_SELECTOR, "[data-e2e='description-input']"),
     (By.CSS_SELECTOR, "[data-e2e='hashtag-input']"),
     (By.CSS_SELECTOR, "[class*='description']"),
     (By.CSS_SELECTOR, "[class*='hashtags']"),
     (By.CSS_SELECTOR, "[class*='edit-cover']"),
-]
+)
+# Qualquer um basta: um único seletor composto (uma consulta por poll em vez de cinco)
+POST_UPLOAD_CSS = ", ".join(value for _by, value in POST_UPLOAD_SELECTORS)
+
+# Editor ou preview de um upload anterior ainda carregado: a aba não serve para um novo vídeo
+UPLOAD_EDITOR_CSS = f"{POST_UPLOAD_CSS}, {PREVIEW_READY_CSS}"
 
 PROGRESS_TOKENS: Set[str] = {
     "minute left", "minutes left", "second left", "seconds left",
@@ -86,6 +118,9 @@ SUCCESS_KEYWORDS: Set[str] = {
     "replace", "details", "description", "hashtags", "mention", "cover edit",
 }
 
+# Alternância única das keywords: uma varredura em C por texto, em vez de um `in` por keyword
+_SUCCESS_KEYWORDS_RE = re.compile("|".join(re.escape(k) for k in sorted(SUCCESS_KEYWORDS)))
+
 PROGRESS_PATTERNS = (
     re.compile(r"\b\d{1,3}(?:\.\d+)?\s?%"),
     re.compile(r"\b\d+(?:\.\d+)?\s?(?:kb|mb|gb)\s*/\s*\d+(?:\.\d+)?\s?(?:kb|mb|gb)\b"),
@@ -113,6 +148,8 @@ class VideoUploadModule:
         self.driver = driver
         self.log = logger if logger else print
         self._file_input_context = None
+        # Instâncias reutilizadas: evita reconstruir WebDriverWait a cada espera
+        self._waits = WaitPool(driver, (WAIT_SHORT, WAIT_MED, WAIT_LONG))
 
     # ===================== MÉTODOS UTILITÁRIOS =====================
 
@@ -142,16 +179,26 @@ class VideoUploadModule:
         return False
 
     @staticmethod
-    def _has_success_partial(norm_text: str, keywords: Set[str]) -> bool:
-        """Partial match para keywords (não só split)"""
-        return any(kw in norm_text for kw in keywords)
+    def _has_success_partial(norm_text: str, pattern: re.Pattern = _SUCCESS_KEYWORDS_RE) -> bool:
+        """Partial match para keywords (não só split), via alternância pré-compilada"""
+        return pattern.search(norm_text) is not None
 
     def _wait_element(self, by, value, timeout=WAIT_MED):
         """Espera elemento aparecer"""
-        return WebDriverWait(self.driver, timeout).until(
+        return self._waits.get(timeout).until(
             EC.presence_of_element_located((by, value))
         )
 
+    def _wait_document_ready(self, timeout: float = WAIT_SHORT) -> bool:
+        """Espera document.readyState == 'complete' (retorna assim que a página carrega)."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except TimeoutException:
+            return False
+
     @contextmanager
     def _frame_context(self, frame_index: Optional[int]):
         """Context manager para switch de frames, auto-reseta para default."""
@@ -181,15 +228,25 @@ class VideoUploadModule:
         Returns:
             Tuple[bool, str]: (válido, mensagem de erro/sucesso)
         """
-        # Verifica existência
-        if not os.path.isfile(video_path):
+        # Existência, tipo e tamanho em um único stat
+        try:
+            st = os.stat(video_path)
+        except FileNotFoundError:
+            return False, f"Arquivo não encontrado: {video_path}"
+        except OSError as e:
+            return False, f"Erro ao acessar arquivo: {video_path} ({e})"
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Arquivo não encontrado: {video_path}"
 
         # Verifica tamanho mínimo (200KB)
-        size_bytes = os.path.getsize(video_path)
-        if size_bytes < 200 * 1024:
+        size_bytes = st.st_size
+        if size_bytes < MIN_VIDEO_SIZE_BYTES:
             return False, f"Vídeo muito pequeno: {size_bytes} bytes (mínimo: 200KB)"
 
+        # Sem leitura o send_keys "funciona" e o upload só falha no timeout de processamento
+        if not os.access(video_path, os.R_OK):
+            return False, f"Sem permissão de leitura: {video_path}"
+
         # Verifica extensão
         _, ext = os.path.splitext(video_path)
         valid_extensions = {'.mp4', '.mov', '.avi', '.webm', '.mkv', '.flv'}
@@ -218,12 +275,20 @@ class VideoUploadModule:
 
     # ===================== NAVEGAÇÃO E LOCALIZAÇÃO =====================
 
+    def _probe_file_input(self, driver) -> Optional[Tuple[int]]:
+        """
+        Condição para WebDriverWait: índice do primeiro seletor de FILE_INPUT_CSS
+        presente no documento atual, numa tupla (o índice 0 não pode ser falsy).
+        """
+        index = driver.execute_script(_FIND_FIRST_SELECTOR_JS, FILE_INPUT_CSS)
+        return None if index is None else (int(index),)
+
     def _scan_for_file_input(self, timeout: int = WAIT_MED) -> bool:
         """
         Procura input de upload na página principal e iframes (otimizado: limite frames, sleeps menores).
         Atualiza self._file_input_context quando encontra.
         """
-        deadline = time.time() + max(timeout, WAIT_SHORT)
+        deadline = time.monotonic() + max(timeout, WAIT_SHORT)
         frame_indices = [None]  # Priorize main primeiro
         try:
             frames = self.driver.find_elements(By.TAG_NAME, "iframe")
@@ -231,25 +296,24 @@ class VideoUploadModule:
         except Exception:
             pass
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             for frame_index in frame_indices:
                 with self._frame_context(frame_index):
-                    for by, value in FILE_INPUT_SELECTORS:
-                        try:
-                            element = self.driver.find_element(by, value)
-                            if element:
-                                label = "principal" if frame_index is None else f"iframe[{frame_index}]"
-                                self._file_input_context = {
-                                    "frame_index": frame_index,
-                                    "by": by,
-                                    "value": value,
-                                }
-                                self.log(f"✅ Campo de upload localizado ({label}) com seletor: {value}")
-                                return True
-                        except NoSuchElementException:
-                            continue
-                        except (StaleElementReferenceException, TimeoutException):
-                            continue  # Específicos para flakiness
+                    # Uma ida ao navegador por frame: o JS testa os seletores na ordem de prioridade
+                    try:
+                        match = self.driver.execute_script(_FIND_FIRST_SELECTOR_JS, FILE_INPUT_CSS)
+                    except WebDriverException:
+                        match = None
+                    if match is not None:
+                        value = FILE_INPUT_CSS[int(match)]
+                        label = "principal" if frame_index is None else f"iframe[{frame_index}]"
+                        self._file_input_context = {
+                            "frame_index": frame_index,
+                            "by": By.CSS_SELECTOR,
+                            "value": value,
+                        }
+                        self.log(f"✅ Campo de upload localizado ({label}) com seletor: {value}")
+                        return True
 
                 time.sleep(0.5)  # Reduzido de 1s para eficiência
             time.sleep(1)  # Outer sleep menor
@@ -280,7 +344,7 @@ class VideoUploadModule:
 
             with self._frame_context(frame_index):
                 try:
-                    element = WebDriverWait(self.driver, WAIT_SHORT).until(
+                    element = self._waits.get(WAIT_SHORT).until(
                         EC.presence_of_element_located((by, value))
                     )
                     return element
@@ -299,14 +363,33 @@ class VideoUploadModule:
             True se conseguiu navegar e encontrou campo de upload, False caso contrário
         """
         self._file_input_context = None
-        urls = [STUDIO_URL, CLASSIC_URL]
+
+        # Fast path: aba já está na página de upload (sessão reaproveitada), com o campo
+        # de arquivo e sem editor/preview do vídeo anterior; senão recarrega
+        try:
+            current_url = (self.driver.current_url or "").lower()
+        except WebDriverException:
+            current_url = ""
+        if any(fragment in current_url for fragment in UPLOAD_PAGE_URL_FRAGMENTS):
+            try:
+                (index,) = WebDriverWait(self.driver, 2, poll_frequency=0.2).until(self._probe_file_input)
+                if self.driver.execute_script("return !document.querySelector(arguments[0]);", UPLOAD_EDITOR_CSS):
+                    value = FILE_INPUT_CSS[index]
+                    self._file_input_context = {"frame_index": None, "by": By.CSS_SELECTOR, "value": value}
+                    self.log(f"✅ Já na página de upload; campo localizado com seletor: {value}")
+                    return True
+                self.log("🔄 Página de upload ainda com editor/preview anterior; recarregando")
+            except WebDriverException:
+                pass
+
+        urls = (STUDIO_URL, CLASSIC_URL)
 
         for url in urls:
             try:
                 self.log(f"🌐 Acessando: {url}")
                 self.driver.set_page_load_timeout(30)
                 self.driver.get(url)
-                time.sleep(3)  # Reduzido de 5s para eficiência
+                self._wait_document_ready(timeout=3)
 
                 current_url = self.driver.current_url
                 self.log(f"🔍 URL atual: {current_url}")
@@ -322,8 +405,8 @@ class VideoUploadModule:
                 # DEBUG: Salva screenshot se não encontrou
                 try:
                     screenshot_path = f"/tmp/tiktok_upload_page_{int(time.time())}.png"
-                    self.driver.save_screenshot(screenshot_path)
-                    self.log(f"📸 Screenshot salvo: {screenshot_path}")
+                    # Só a captura precisa da thread do driver; a gravação em disco vai para segundo plano
+                    write_bytes_async(screenshot_path, self.driver.get_screenshot_as_png(), self.log, "Screenshot")
                     page_title = self.driver.title
                     self.log(f"📄 Título da página: {page_title}")
                 except Exception:
@@ -348,49 +431,34 @@ class VideoUploadModule:
             success_snippets = []
             seen_norm = set()
 
-            for by, value in STATUS_TEXT_SELECTORS:  # Já como tuples
-                try:
-                    elements = self.driver.find_elements(by, value)
-                except Exception:
-                    continue
-
-                for element in elements:
-                    try:
-                        text = element.text.strip()
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception:
-                        continue
+            try:
+                texts, body_text = self.driver.execute_script(STATUS_TEXTS_JS, STATUS_TEXT_XPATHS)
+            except Exception:
+                return progress_snippets, success_snippets
 
-                    if not text:
-                        continue
+            for text in texts or ():
+                norm_text = self._normalize_text(text)
+                if not norm_text or norm_text in seen_norm:
+                    continue
 
-                    norm_text = self._normalize_text(text)
-                    if not norm_text or norm_text in seen_norm:
-                        continue
+                seen_norm.add(norm_text)
+                snippet = self._shorten_text(text)
 
-                    seen_norm.add(norm_text)
-                    snippet = self._shorten_text(text)
+                if self._is_progress_text(norm_text):
+                    progress_snippets.append(snippet)
+                elif self._has_success_partial(norm_text):  # Partial match
+                    success_snippets.append(snippet)
 
-                    if self._is_progress_text(norm_text):
+            # Verifica body também (fallback crítico)
+            if body_text:
+                norm_body = self._normalize_text(body_text)
+                if norm_body and norm_body not in seen_norm:
+                    snippet = self._shorten_text(body_text)
+                    if self._is_progress_text(norm_body):
                         progress_snippets.append(snippet)
-                    elif self._has_success_partial(norm_text, SUCCESS_KEYWORDS):  # Partial match
+                    elif self._has_success_partial(norm_body):
                         success_snippets.append(snippet)
 
-            # Verifica body também (fallback crítico)
-            try:
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text
-                if body_text:
-                    norm_body = self._normalize_text(body_text)
-                    if norm_body and norm_body not in seen_norm:
-                        snippet = self._shorten_text(body_text)
-                        if self._is_progress_text(norm_body):
-                            progress_snippets.append(snippet)
-                        elif self._has_success_partial(norm_body, SUCCESS_KEYWORDS):
-                            success_snippets.append(snippet)
-            except Exception:
-                pass
-
             return progress_snippets, success_snippets
 
     def wait_upload_completion(self, timeout: int = 300) -> bool:
@@ -403,12 +471,13 @@ class VideoUploadModule:
         Returns:
             True se upload finalizado, False se timeout
         """
-        deadline = time.time() + max(timeout, 30)
+        deadline = time.monotonic() + max(timeout, 30)
         last_progress = ""
-        last_progress_time = time.time()
+        last_progress_time = time.monotonic()
         stall_threshold = 20  # Segundos sem mudança em 90%+ = sucesso
+        interval = PROGRESS_POLL_MIN  # Backoff adaptativo enquanto o progresso não muda
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             progress_snippets, success_snippets = self._scan_status_messages()  # Prioritário: texto sempre
 
             if success_snippets:
@@ -418,39 +487,38 @@ class VideoUploadModule:
 
             if progress_snippets:
                 summary = "; ".join(progress_snippets[:2])
-                current_time = time.time()
+                current_time = time.monotonic()
                 # Check stall para 90%+
-                if re.search(r"\b9\d{1,2}%", summary):  # >=90%
-                    if summary != last_progress:
-                        self.log(f"⏳ Upload em andamento: {summary}")
-                        last_progress = summary
-                        last_progress_time = current_time
-                    elif current_time - last_progress_time > stall_threshold:
+                if summary != last_progress:
+                    self.log(f"⏳ Upload em andamento: {summary}")
+                    last_progress = summary
+                    last_progress_time = current_time
+                    interval = PROGRESS_POLL_MIN
+                else:
+                    # Check stall para 90%+
+                    if re.search(r"\b9\d{1,2}%", summary) and current_time - last_progress_time > stall_threshold:
                         self.log(f"✅ Upload estagnado >{stall_threshold}s em 90%+ (assumindo sucesso: {summary})")
                         return True
-                else:
-                    if summary != last_progress:
-                        self.log(f"⏳ Upload em andamento: {summary}")
-                        last_progress = summary
-                        last_progress_time = current_time
+                    interval = min(interval * 2, PROGRESS_POLL_MAX)
+                time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
                 continue
 
             # UI Check: Elementos pós-upload (ex.: description field)
             try:
-                wait = WebDriverWait(self.driver, 5)
-                post_ui_ec = [EC.presence_of_element_located(sel) for sel in POST_UPLOAD_SELECTORS]
-                post_elem = wait.until(EC.any_of(*post_ui_ec))
+                post_elem = self._waits.get(WAIT_SHORT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, POST_UPLOAD_CSS))
+                )
                 self.log(f"✅ UI pós-upload detectada: {post_elem.tag_name} (pronto para edição)")
                 return True
             except TimeoutException:
+                # A própria espera de 5s acima já espaça as iterações
                 pass
 
-            time.sleep(2)  # Sleep reduzido
-
         # Scan final melhorado
         self.log("⚠️ Timeout atingido; scan final para confirmação...")
         _, success_snippets = self._scan_status_messages()
-        if success_snippets or self._has_success_partial(self.driver.find_element(By.TAG_NAME, "body").text, SUCCESS_KEYWORDS):
+        body_text = self._normalize_text(self.driver.find_element(By.TAG_NAME, "body").text)
+        if success_snippets or self._has_success_partial(body_text):
             self.log(f"✅ Upload detectado no scan final")
             return True
 
@@ -477,9 +545,10 @@ class VideoUploadModule:
             self.log(f"❌ {msg}")
             return False
 
-        abs_path = os.path.abspath(video_path)
+        # isabs é só checagem de string; abspath apenas para caminhos relativos
+        abs_path = video_path if os.path.isabs(video_path) else os.path.abspath(video_path)
         attempts = 2 if retry else 1
-        backoff = [2, 4]  # Sleeps crescentes
+        backoff = (2, 4)  # Sleeps crescentes
 
         for attempt in range(attempts):
             upload_input = self._resolve_file_input(timeout=WAIT_MED)
@@ -530,20 +599,14 @@ class VideoUploadModule:
 
         # Aguarda processamento inicial (preview aparecer)
         try:
-            WebDriverWait(self.driver, WAIT_LONG).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "video")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "canvas")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='preview']")),
-                )
+            self._waits.get(WAIT_LONG).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PREVIEW_READY_CSS))
             )
             self.log("🎬 Vídeo processado (preview disponível)")
         except TimeoutException:
             self.log("⚠️ Timeout aguardando processamento inicial")
             return False
 
-        time.sleep(2)  # Reduzido de 3s
-
         # Aguarda upload completar (agora com UI check)
         if not self.wait_upload_completion(timeout=300):
             return False
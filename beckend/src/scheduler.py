@@ -39,6 +39,8 @@ MAX_POSTS_PER_TICK = int(os.getenv("TIKTOK_MAX_POSTS_PER_TICK", "3"))
 FAST_CATCHUP_SECONDS = int(os.getenv("TIKTOK_FAST_CATCHUP_SECONDS", "20"))
 BURST_RESCHEDULE_GAP_SECONDS = float(os.getenv("TIKTOK_BURST_RESCHEDULE_GAP_SECONDS", "30"))
 BURST_RESCHEDULE_WINDOW_SECONDS = float(os.getenv("TIKTOK_BURST_RESCHEDULE_WINDOW_SECONDS", "120"))
+# Janela em que uma sessão recém-validada é reutilizada sem ping/current_url
+SESSION_RECHECK_SECONDS = float(os.getenv("TIKTOK_SESSION_RECHECK_SECONDS", "30"))
 
 TRANSIENT_DRIVER_ERRORS = [WebDriverException, ConnectionError, socket.error]
 for _extra in (MaxRetryError, NewConnectionError, ConnectTimeoutError):
@@ -287,6 +289,7 @@ class TikTokScheduler:
         self.kill_chrome_processes()
         self._temp_profile_dir = None
         self._chromedriver_pid = None
+        self._session_ok_at: Optional[float] = None
         self.log(f"🟢 Sistema iniciado para conta: {account_name}")
 
     def log(self, msg: str):
@@ -384,6 +387,7 @@ class TikTokScheduler:
         self.kill_chrome_processes()
         self._temp_profile_dir = None
         self._chromedriver_pid = None
+        self._session_ok_at = None
 
     def _ensure_logged(self) -> bool:
         if TEST_MODE:
@@ -414,6 +418,16 @@ class TikTokScheduler:
             self.log("❌ Cookies marcados como inválidos. Atualize-os via painel antes de novas tentativas.")
             return False
 
+        # Sessão validada há pouco (ex.: ticks de catch-up seguidos): dispensa o round-trip.
+        # close_driver zera o timestamp, então um driver recriado é sempre verificado.
+        session_ok_at = getattr(self, "_session_ok_at", None)
+        if (
+            session_ok_at is not None
+            and getattr(self, "driver", None) is not None
+            and time.monotonic() - session_ok_at < SESSION_RECHECK_SECONDS
+        ):
+            return True
+
         for attempt in range(1, attempt_limit + 1):
             ok = False
             if attempt > 1:
@@ -421,7 +435,9 @@ class TikTokScheduler:
 
             try:
                 existing = getattr(self, "driver", None)
-                if existing and is_session_alive(existing):
+                # Um único ping por tentativa (antes: até dois is_session_alive seguidos)
+                alive = bool(existing) and is_session_alive(existing)
+                if alive:
                     try:
                         current_url = existing.current_url.lower()
                     except Exception:
@@ -430,9 +446,10 @@ class TikTokScheduler:
                         self.log("🔄 Reutilizando sessão Chrome já autenticada")
                         # Limpa timestamp de falha (sessão OK)
                         self._last_cookie_failure_time = None
+                        self._session_ok_at = time.monotonic()
                         return True
 
-                if existing and not is_session_alive(existing):
+                if existing and not alive:
                     self.close_driver()
 
                 if self.driver is None:
@@ -453,6 +470,7 @@ class TikTokScheduler:
                     self.log(f"✅ Login via cookies OK para: {self.account}")
                     # Limpa timestamp de falha (sucesso!)
                     self._last_cookie_failure_time = None
+                    self._session_ok_at = time.monotonic()
                     return True
                 last_error = "cookies inválidos"
                 self.log(f"❌ Falha no login com cookies (tentativa {attempt}/{attempt_limit})")
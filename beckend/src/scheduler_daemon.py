@@ -5,6 +5,7 @@ import logging
 import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 
 try:
@@ -54,7 +55,12 @@ class SchedulerDaemon:
         self._schedulers: Dict[str, TikTokScheduler] = {}
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Acorda o loop no stop sem esperar o fim do poll_interval
+        self._wake_cond = threading.Condition()
         self._thread: Optional[threading.Thread] = None
+        # Conjunto de contas da última sincronização e rótulo ordenado para log
+        self._known_accounts: frozenset = frozenset()
+        self._sorted_names: str = ""
 
     def start(self) -> "SchedulerDaemon":
         with self._lock:
@@ -74,9 +80,12 @@ class SchedulerDaemon:
     def stop(self) -> None:
         with self._lock:
             self._stop_event.set()
-            if self._thread and self._thread.is_alive():
-                self._thread.join(timeout=self.poll_interval + 5)
-            self._thread = None
+            thread, self._thread = self._thread, None
+        with self._wake_cond:
+            self._wake_cond.notify_all()
+        # Join fora do _lock: o loop pode estar aguardando o lock em _sync_accounts
+        if thread and thread.is_alive():
+            thread.join(timeout=self.poll_interval + 5)
         self._stop_all_schedulers()
         _log("Daemon encerrado")
 
@@ -88,7 +97,12 @@ class SchedulerDaemon:
                 _log(f"Erro inesperado: {exc}", level="error")
                 traceback.print_exc()
             finally:
-                self._stop_event.wait(self.poll_interval)
+                self._wait_next_cycle()
+
+    def _wait_next_cycle(self) -> None:
+        """Bloqueia até o próximo ciclo, retornando imediatamente no stop."""
+        with self._wake_cond:
+            self._wake_cond.wait_for(self._stop_event.is_set, timeout=self.poll_interval)
 
     def _sync_accounts(self) -> None:
         """
@@ -102,15 +116,24 @@ class SchedulerDaemon:
             _log("Nenhuma conta ativa encontrada")
             # Para todos os schedulers se não há contas
             with self._lock:
-                for account_name in list(self._schedulers.keys()):
-                    self._stop_scheduler(account_name)
+                self._stop_all_schedulers()
             return
 
-        account_names = {acc.account_name.strip() for acc in active_accounts if acc.account_name}
+        account_names = frozenset(acc.account_name.strip() for acc in active_accounts if acc.account_name)
         if not account_names:
             return
 
+        # Só reordena os nomes quando o conjunto de contas muda entre ciclos
+        if account_names != self._known_accounts:
+            self._known_accounts = account_names
+            self._sorted_names = ", ".join(sorted(account_names))
+
         with self._lock:
+            # Caminho rápido: nada mudou desde o último ciclo, dispensa o diff de conjuntos
+            if self._schedulers.keys() == account_names:
+                _log(f"✓ Rodando {len(account_names)} scheduler(s) simultaneamente: {self._sorted_names}")
+                return
+
             current_accounts = set(self._schedulers.keys())
 
             # Para schedulers de contas que foram desativadas
@@ -125,7 +148,7 @@ class SchedulerDaemon:
 
             # Log do status atual
             if len(account_names) > 0:
-                _log(f"✓ Rodando {len(account_names)} scheduler(s) simultaneamente: {', '.join(sorted(account_names))}")
+                _log(f"✓ Rodando {len(account_names)} scheduler(s) simultaneamente: {self._sorted_names}")
 
     def _fetch_active_accounts(self):
         db = SessionLocal()
@@ -168,8 +191,17 @@ class SchedulerDaemon:
             _log(f"Scheduler encerrado para '{account_name}'")
 
     def _stop_all_schedulers(self) -> None:
-        for account_name in list(self._schedulers.keys()):
-            self._stop_scheduler(account_name)
+        """Encerra todos os schedulers em paralelo; cada stop pode bloquear até 5s no join."""
+        account_names = list(self._schedulers.keys())
+        if len(account_names) <= 1:
+            for account_name in account_names:
+                self._stop_scheduler(account_name)
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(16, len(account_names)),
+            thread_name_prefix="SchedulerStop",
+        ) as executor:
+            list(executor.map(self._stop_scheduler, account_names))
 
 
 _daemon_instance: Optional[SchedulerDaemon] = None
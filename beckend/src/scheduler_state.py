@@ -11,9 +11,15 @@ from __future__ import annotations
 import json
 import os
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
+
+try:
+    import orjson  # parse direto de bytes, sem decodificar para str antes
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 STATE_DIR = Path(os.getenv("BASE_STATE_DIR", "./state"))
@@ -23,16 +29,31 @@ STATE_FILE = STATE_DIR / "scheduler_state.json"
 _lock = threading.Lock()
 
 
+# Último timestamp gerado: (time.monotonic(), isoformat). Atualizações no mesmo
+# tick reaproveitam a string; os consumidores só usam resolução de segundos.
+_NOW_ISO_TTL = 0.05
+_last_now_iso: Tuple[float, str] = (float("-inf"), "")
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    global _last_now_iso
+    mono = time.monotonic()
+    cached_at, cached = _last_now_iso
+    if mono - cached_at <= _NOW_ISO_TTL:
+        return cached
+    value = datetime.now(timezone.utc).isoformat()
+    _last_now_iso = (mono, value)
+    return value
 
 
 def _load_state() -> Dict[str, dict]:
     if not STATE_FILE.exists():
         return {}
     try:
-        raw = STATE_FILE.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        if orjson is not None:
+            data = orjson.loads(STATE_FILE.read_bytes())
+        else:
+            data = json.loads(STATE_FILE.read_text(encoding="utf-8"))
         if isinstance(data, dict):
             return data
     except Exception:
@@ -40,10 +61,37 @@ def _load_state() -> Dict[str, dict]:
     return {}
 
 
+def _file_signature() -> Optional[Tuple[int, int]]:
+    """(mtime_ns, tamanho) do arquivo de estado, ou None se ele não existir."""
+    try:
+        st = STATE_FILE.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _save_state(state: Dict[str, dict]) -> None:
+    global _cache_signature
     tmp_path = STATE_FILE.with_suffix(".tmp")
     tmp_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
     tmp_path.replace(STATE_FILE)
+    _cache_signature = _file_signature()
+
+
+# O scheduler e a API rodam em processos separados: o cache só é reaproveitado
+# enquanto a assinatura do arquivo não mudar; qualquer escrita externa força releitura.
+_state_cache: Dict[str, dict] = {}
+_cache_signature: Optional[Tuple[int, int]] = None
+
+
+def _cache() -> Dict[str, dict]:
+    """Cache em memória do estado, relido se o arquivo mudou. Chamar com _lock."""
+    global _state_cache, _cache_signature
+    signature = _file_signature()
+    if signature != _cache_signature:
+        _state_cache = _load_state()
+        _cache_signature = signature
+    return _state_cache
 
 
 def update_state(
@@ -63,7 +111,7 @@ def update_state(
         return
 
     with _lock:
-        state = _load_state()
+        state = _cache()
         entry = state.get(account_name, {})
 
         entry.setdefault("account_name", account_name)
@@ -95,7 +143,7 @@ def clear_state(account_name: str) -> None:
     if not account_name:
         return
     with _lock:
-        state = _load_state()
+        state = _cache()
         if account_name in state:
             del state[account_name]
             _save_state(state)
@@ -104,12 +152,11 @@ def clear_state(account_name: str) -> None:
 def get_state(account_name: Optional[str] = None) -> Dict[str, dict]:
     """Recupera o estado de todas as contas ou de uma específica."""
     with _lock:
-        state = _load_state()
-
-    if account_name:
-        entry = state.get(account_name)
-        return {account_name: entry} if entry else {}
-    return state
+        state = _cache()
+        if account_name:
+            entry = state.get(account_name)
+            return {account_name: dict(entry)} if entry else {}
+        return {name: dict(entry) for name, entry in state.items()}
 
 
 def merge_update(account_name: str, **fields: Any) -> None:
@@ -6,19 +6,31 @@ e estruturando o retorno para uso no backend.
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import os
 import re
+import select
 import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 import subprocess
 import hashlib
-import random
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import requests
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 from requests.cookies import RequestsCookieJar
 from urllib.parse import urlencode
 
@@ -36,11 +48,226 @@ API_USER_DETAIL_URL = "https://www.tiktok.com/api/user/detail/"
 API_POST_ITEM_LIST_URL = "https://www.tiktok.com/api/post/item_list/"
 SIGNER_SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "tiktok_signer.js"
 
+# Pool compartilhado para disparar a chamada da API em paralelo ao GET do HTML
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tiktok-api")
+
+# identifier -> (sec_uid, unique_id, device_id, resolvido_em). Compartilhado entre
+# instâncias, já que as rotas criam um TikTokScraper por requisição.
+_IDENTITY_CACHE_TTL = 3600.0
+_IDENTITY_CACHE_MAXSIZE = 4096
+_identity_cache: Dict[str, Tuple[str, str, str, float]] = {}
+_identity_cache_lock = threading.Lock()
+
+# Padrões de extração dos campos do perfil; cada um tem exatamente um grupo de captura
+_HTML_PATTERN_SOURCES: Dict[str, str] = {
+    "user_id": r'"webapp.user-detail":{"userInfo":{"user":{"id":"(\d+)"',
+    "unique_id": r'"uniqueId":"(.*?)"',
+    "nickname": r'"nickname":"(.*?)"',
+    "followers": r'"followerCount":(\d+)',
+    "following": r'"followingCount":(\d+)',
+    "likes": r'"heartCount":(\d+)',
+    "videos": r'"videoCount":(\d+)',
+    "signature": r'"signature":"(.*?)"',
+    "verified": r'"verified":(true|false)',
+    "secUid": r'"secUid":"(.*?)"',
+    "commentSetting": r'"commentSetting":(\d+)',
+    "privateAccount": r'"privateAccount":(true|false)',
+    "region": r'"ttSeller":false,"region":"([^"]*)"',
+    "heart": r'"heart":(\d+)',
+    "diggCount": r'"diggCount":(\d+)',
+    "friendCount": r'"friendCount":(\d+)',
+    "profile_pic": r'"avatarLarger":"(.*?)"',
+}
+
+# Alternância única com um grupo nomeado por campo: o HTML é percorrido uma só vez
+# e `match.lastgroup` indica qual campo casou. Todas as alternativas começam com
+# uma chave JSON entre aspas, então não há sobreposição entre as capturas.
+_HTML_FIELDS_RE = re.compile(
+    "|".join(
+        re.sub(r"\((?!\?)", f"(?P<{key}>", pattern, count=1)
+        for key, pattern in _HTML_PATTERN_SOURCES.items()
+    )
+)
+
+_REHYDRATION_MARKER = "__UNIVERSAL_DATA_FOR_REHYDRATION__"
+
+# (campo em info, seção em userInfo, chave no JSON) — mesmos campos do caminho por regex
+_REHYDRATION_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("user_id", "user", "id"),
+    ("unique_id", "user", "uniqueId"),
+    ("nickname", "user", "nickname"),
+    ("signature", "user", "signature"),
+    ("verified", "user", "verified"),
+    ("secUid", "user", "secUid"),
+    ("commentSetting", "user", "commentSetting"),
+    ("privateAccount", "user", "privateAccount"),
+    ("region", "user", "region"),
+    ("profile_pic", "user", "avatarLarger"),
+    ("followers", "stats", "followerCount"),
+    ("following", "stats", "followingCount"),
+    ("likes", "stats", "heartCount"),
+    ("videos", "stats", "videoCount"),
+    ("heart", "stats", "heart"),
+    ("diggCount", "stats", "diggCount"),
+    ("friendCount", "stats", "friendCount"),
+)
+
+_BIO_URL_LINK_RE = re.compile(
+    r'href="(https://www\.tiktok\.com/link/v2\?[^"]*?scene=bio_url[^"]*?target=([^"&]+))"'
+)
+_SPAN_LINK_RE = re.compile(r'<span[^>]*class="[^\"]*SpanLink[^\"]*">([^<]+)</span>')
+_BIO_URL_TARGET_RE = re.compile(r'scene=bio_url[^"]*?target=([^"&]+)')
+_BIO_LINK_JSON_RE = re.compile(r'"bioLink":{"link":"([^"]+)","risk":(\d+)}')
+_SHARE_URL_RE = re.compile(r'"shareUrl":"([^"]+)"')
+_SHARE_LINKS_DIV_RE = re.compile(
+    r'<div[^>]*class="[^\"]*DivShareLinks[^\"]*"[^>]*>(.*?)</div>', re.DOTALL
+)
+_SHARE_LINKS_ANCHOR_RE = re.compile(
+    r'<a[^>]*href="[^"]*scene=bio_url[^"]*target=([^"&]+)"[^>]*>.*?<span[^>]*class="[^\"]*SpanLink[^\"]*">([^<]+)</span>',
+    re.DOTALL,
+)
+# (grupo, rótulo, prefixo): a ordem define a ordem de saída dos links da bio
+_BIO_SOCIAL_LABELS: Tuple[Tuple[str, str, str], ...] = (
+    ("instagram", "Instagram", "@"),
+    ("snapchat", "Snapchat", ""),
+    ("twitter", "Twitter/X", "@"),
+    ("facebook", "Facebook", ""),
+    ("youtube", "YouTube", ""),
+    ("telegram", "Telegram", "@"),
+)
+# Uma única passada na bio; m.lastgroup indica qual rede casou
+_BIO_SOCIAL_RE = re.compile(
+    r'(?P<instagram>[iI][gG]:\s*@?(?P<instagram_user>[a-zA-Z0-9._]+))'
+    r'|(?P<snapchat>(?:[sS][cC]|[sS]napchat):\s*@?(?P<snapchat_user>[a-zA-Z0-9._]+))'
+    r'|(?P<twitter>(?:[tT]witter|[xX]):\s*@?(?P<twitter_user>[a-zA-Z0-9._]+))'
+    r'|(?P<facebook>[fF][bB]:\s*@?(?P<facebook_user>[a-zA-Z0-9._]+))'
+    r'|(?P<youtube>(?:[yY][tT]|[yY]outube):\s*@?(?P<youtube_user>[a-zA-Z0-9._]+))'
+    r'|(?P<telegram>[tT]elegram:\s*@?(?P<telegram_user>[a-zA-Z0-9._]+))'
+)
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
+
+# Cookies das contas: account_name -> (st_mtime_ns do cookies_latest.json, jar, msToken)
+_cookie_cache: Dict[str, Tuple[int, RequestsCookieJar, Optional[str]]] = {}
+_cookie_cache_lock = threading.Lock()
+_account_storage: Optional[AccountStorage] = None
+
+
+def _get_account_storage() -> AccountStorage:
+    global _account_storage
+    if _account_storage is None:
+        _account_storage = AccountStorage()
+    return _account_storage
+
+
+class _SignerWorker:
+    """
+    Processo Node persistente (`tiktok_signer.js --server`) para gerar X-Bogus.
+
+    Evita o custo de fork+exec+inicialização do V8 a cada requisição assinada.
+    Uma requisição por vez (protegido por lock); o processo é recriado
+    automaticamente se morrer ou deixar de responder.
+    """
+
+    def __init__(self, script_path: Path) -> None:
+        self._script_path = script_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        # Bytes lidos do stdout além da última linha entregue
+        self._buffer = b""
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["node", str(self._script_path), "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        self._buffer = b""
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except Exception:
+            pass
+
+    def _read_line(self, proc: subprocess.Popen, deadline: float) -> Optional[bytes]:
+        """
+        Lê uma linha do stdout do worker até `deadline` (time.monotonic()).
+        Usa os.read no fd, pois readline() bloquearia sem limite numa linha parcial.
+        Retorna b"" se o processo encerrou e None no timeout.
+        """
+        fd = proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                return b""
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+    def sign(self, url: str, user_agent: str, timeout: float = 10.0) -> Optional[str]:
+        """Retorna a assinatura ou None. Propaga FileNotFoundError se o Node não existir."""
+        with self._lock:
+            for _attempt in range(2):
+                if self._proc is None or self._proc.poll() is not None:
+                    self._proc = self._spawn()
+                proc = self._proc
+                try:
+                    # Pipes em modo binário: sem camada TextIOWrapper; a resposta vai
+                    # direto em bytes para o parser JSON
+                    proc.stdin.write(f"{url}\t{user_agent}\n".encode("utf-8"))
+                    proc.stdin.flush()
+                    line = self._read_line(proc, time.monotonic() + timeout)
+                    if line is None:
+                        logger.warning("Geração do X-Bogus excedeu o tempo limite para %s", url)
+                        self._kill()
+                        return None
+                except (BrokenPipeError, OSError, ValueError):
+                    self._kill()
+                    continue
+                if not line:
+                    # Processo encerrou (ex.: falha ao baixar o acrawler); tenta recriar uma vez
+                    self._kill()
+                    continue
+                try:
+                    response = _json_loads(line)
+                except ValueError:
+                    logger.debug("Resposta inválida do assinador X-Bogus: %r", line)
+                    return None
+                if not response.get("ok"):
+                    logger.debug("Falha ao gerar X-Bogus: %s", response.get("error"))
+                    return None
+                return (response.get("signature") or "").strip() or None
+        return None
+
+
+_SIGNER_WORKER = _SignerWorker(SIGNER_SCRIPT_PATH)
+atexit.register(_SIGNER_WORKER.close)
+
 
 class TikTokScraperError(RuntimeError):
     """Erro genérico do scraper."""
 
 
+class TikTokRateLimitError(TikTokScraperError):
+    """TikTok respondeu 429 (limite de requisições)."""
+
+
 @dataclass
 class TikTokProfileData:
     """Estrutura normalizada com métricas essenciais do perfil."""
@@ -67,6 +294,53 @@ class TikTokProfileData:
     raw: Dict[str, Any]
 
 
+# Parâmetros fixos do item_list; só count/device_id/uniqueId/secUid/msToken variam por chamada
+_POST_LIST_CONST_PARAMS: Tuple[Tuple[str, str], ...] = (
+    ("aid", "1988"),
+    ("app_language", "pt-BR"),
+    ("app_name", "tiktok_web"),
+    ("browser_language", "pt-BR"),
+    ("browser_name", "Mozilla"),
+    ("browser_online", "true"),
+    ("browser_platform", "Win32"),
+    ("channel", "tiktok_web"),
+    ("cookie_enabled", "true"),
+    ("cursor", "0"),
+    ("device_platform", "web_pc"),
+    ("focus_state", "true"),
+    ("from_page", "user"),
+    ("history_len", "3"),
+    ("is_fullscreen", "false"),
+    ("is_page_visible", "true"),
+    ("language", "pt"),
+    ("os", "windows"),
+    ("priority_region", ""),
+    ("referer", ""),
+    ("region", "BR"),
+    ("screen_height", "1080"),
+    ("screen_width", "1920"),
+    ("tz_name", "America/Sao_Paulo"),
+)
+
+
+@lru_cache(maxsize=8)
+def _post_list_const_query(user_agent: str) -> str:
+    """Query string já codificada da parte constante (inclui browser_version do UA)."""
+    params = _POST_LIST_CONST_PARAMS + (("browser_version", user_agent.split("Chrome/")[-1]),)
+    return urlencode(params)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decodifica o corpo direto dos bytes com orjson, sem passar pelo decoder do requests."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def _safe_int(value: Any) -> Optional[int]:
     try:
         if value is None:
@@ -87,15 +361,9 @@ def _safe_bool(value: Any) -> bool:
 
 
 def _merge_social_links(*lists: Sequence[str]) -> List[str]:
-    seen = set()
-    merged: List[str] = []
-    for candidate_list in lists:
-        for entry in candidate_list or []:
-            normalized = entry.strip()
-            if normalized and normalized not in seen:
-                seen.add(normalized)
-                merged.append(normalized)
-    return merged
+    # dict.fromkeys deduplica preservando a ordem da primeira ocorrência
+    stripped = (entry.strip() for candidate_list in lists if candidate_list for entry in candidate_list)
+    return list(dict.fromkeys(entry for entry in stripped if entry))
 
 
 class TikTokScraper:
@@ -134,7 +402,12 @@ class TikTokScraper:
             if response.status_code != 200:
                 return None, []
 
-            data = response.json()
+            # Respostas vazias/de erro (comuns com status 200) são descartadas sem decodificar
+            body = response.content
+            if not body or b'"userInfo"' not in body:
+                return None, []
+
+            data = _json_loads(body)
             user_info = data.get("userInfo") or {}
             user = user_info.get("user") or {}
             stats = user_info.get("stats") or {}
@@ -180,32 +453,50 @@ class TikTokScraper:
     # HTML parsing helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _extract_patterns(html: str) -> Dict[str, Any]:
-        patterns = {
-            "user_id": r'"webapp.user-detail":{"userInfo":{"user":{"id":"(\d+)"',
-            "unique_id": r'"uniqueId":"(.*?)"',
-            "nickname": r'"nickname":"(.*?)"',
-            "followers": r'"followerCount":(\d+)',
-            "following": r'"followingCount":(\d+)',
-            "likes": r'"heartCount":(\d+)',
-            "videos": r'"videoCount":(\d+)',
-            "signature": r'"signature":"(.*?)"',
-            "verified": r'"verified":(true|false)',
-            "secUid": r'"secUid":"(.*?)"',
-            "commentSetting": r'"commentSetting":(\d+)',
-            "privateAccount": r'"privateAccount":(true|false)',
-            "region": r'"ttSeller":false,"region":"([^"]*)"',
-            "heart": r'"heart":(\d+)',
-            "diggCount": r'"diggCount":(\d+)',
-            "friendCount": r'"friendCount":(\d+)',
-            "profile_pic": r'"avatarLarger":"(.*?)"',
+    def _extract_rehydration_data(html: str) -> Dict[str, Any]:
+        """
+        Lê os campos do perfil direto do JSON embutido em
+        <script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">. Retorna {} se ausente/inválido.
+        """
+        marker = html.find(_REHYDRATION_MARKER)
+        if marker < 0:
+            return {}
+        start = html.find(">", marker) + 1
+        end = html.find("</script>", start)
+        if start <= 0 or end < 0:
+            return {}
+
+        payload = html[start:end]
+        try:
+            data = _json_loads(payload)
+            user_info = data["__DEFAULT_SCOPE__"]["webapp.user-detail"]["userInfo"]
+        except (ValueError, KeyError, TypeError):
+            return {}
+        if not isinstance(user_info, dict):
+            return {}
+
+        sections = {
+            "user": user_info.get("user") or {},
+            "stats": user_info.get("stats") or {},
         }
+        info: Dict[str, Any] = {}
+        for field, section, key in _REHYDRATION_FIELDS:
+            value = sections[section].get(key)
+            if value is not None:
+                info[field] = value
+        return info
 
+    @staticmethod
+    def _extract_patterns(html: str) -> Dict[str, Any]:
         info: Dict[str, Any] = {}
-        for key, pattern in patterns.items():
-            match = re.search(pattern, html)
-            if match:
-                info[key] = match.group(1)
+        remaining = len(_HTML_PATTERN_SOURCES)
+        for match in _HTML_FIELDS_RE.finditer(html):
+            key = match.lastgroup
+            if key not in info:
+                info[key] = match.group(key)
+                remaining -= 1
+                if not remaining:
+                    break
 
         return info
 
@@ -213,10 +504,11 @@ class TikTokScraper:
     def _extract_social_links(html: str, bio_text: str) -> List[str]:
         social_links: List[str] = []
 
-        link_urls = re.findall(
-            r'href="(https://www\\.tiktok\\.com/link/v2\?[^"]*?scene=bio_url[^"]*?target=([^"&]+))"',
-            html,
-        )
+        # Testes de substring baratos evitam varrer o HTML inteiro (e os padrões
+        # DOTALL) quando o bloco correspondente não existe na página.
+        has_bio_url = "scene=bio_url" in html
+
+        link_urls = _BIO_URL_LINK_RE.findall(html) if has_bio_url else ()
         for full_url, target in link_urls:
             target_decoded = urllib.parse.unquote(target)
             text_pattern = rf'href="{re.escape(full_url)}"[^>]*>.*?<span[^>]*SpanLink[^>]*>([^<]+)</span>'
@@ -226,14 +518,14 @@ class TikTokScraper:
             if entry not in social_links:
                 social_links.append(entry)
 
-        span_links = re.findall(r'<span[^>]*class="[^\"]*SpanLink[^\"]*">([^<]+)</span>', html)
+        span_links = _SPAN_LINK_RE.findall(html) if "SpanLink" in html else ()
         for span_text in span_links:
             if "." in span_text and " " not in span_text:
                 entry = f"Link: {span_text} - {span_text}"
                 if entry not in social_links:
                     social_links.append(entry)
 
-        all_targets = re.findall(r'scene=bio_url[^"]*?target=([^"&]+)', html)
+        all_targets = _BIO_URL_TARGET_RE.findall(html) if has_bio_url else ()
         for target in all_targets:
             target_decoded = urllib.parse.unquote(target)
             text_pattern = rf'target={re.escape(target)}[^>]*>.*?<span[^>]*>([^<]+)</span>'
@@ -243,57 +535,45 @@ class TikTokScraper:
             if entry not in social_links:
                 social_links.append(entry)
 
-        bio_link_pattern = r'"bioLink":{"link":"([^"]+)","risk":(\d+)}'
-        for link, _ in re.findall(bio_link_pattern, html):
-            clean_link = link.replace("\\u002F", "/")
-            entry = f"💎 **{clean_link}**: `{clean_link}`"
-            if entry not in social_links:
-                social_links.append(entry)
-
-        shared_links_pattern = r'"shareUrl":"([^"]+)"'
-        for shared_url in re.findall(shared_links_pattern, html):
-            clean_url = shared_url.replace("\\u002F", "/")
-            entry = f"💎 **{clean_url}**: `{clean_url}`"
-            if entry not in social_links:
-                social_links.append(entry)
+        if '"bioLink"' in html:
+            for link, _ in _BIO_LINK_JSON_RE.findall(html):
+                clean_link = link.replace("\\u002F", "/")
+                entry = f"💎 **{clean_link}**: `{clean_link}`"
+                if entry not in social_links:
+                    social_links.append(entry)
 
-        share_links_div_pattern = re.compile(
-            r'<div[^>]*class="[^\"]*DivShareLinks[^\"]*"[^>]*>(.*?)</div>', re.DOTALL
-        )
-        for div_match in share_links_div_pattern.finditer(html):
-            div_content = div_match.group(1)
-            div_links = re.finditer(
-                r'<a[^>]*href="[^"]*scene=bio_url[^"]*target=([^"&]+)"[^>]*>.*?<span[^>]*class="[^\"]*SpanLink[^\"]*">([^<]+)</span>',
-                div_content,
-                re.DOTALL,
-            )
-            for link_match in div_links:
-                target = urllib.parse.unquote(link_match.group(1))
-                link_text = link_match.group(2)
-                entry = f"💎 **{link_text}**: `{target}`"
+        if '"shareUrl"' in html:
+            for shared_url in _SHARE_URL_RE.findall(html):
+                clean_url = shared_url.replace("\\u002F", "/")
+                entry = f"💎 **{clean_url}**: `{clean_url}`"
                 if entry not in social_links:
                     social_links.append(entry)
 
-        bio = bio_text or ""
-        social_patterns = {
-            "Instagram": r'[iI][gG]:\s*@?([a-zA-Z0-9._]+)',
-            "Snapchat": r'([sS][cC]|[sS]napchat):\s*@?([a-zA-Z0-9._]+)',
-            "Twitter/X": r'([tT]witter|[xX]):\s*@?([a-zA-Z0-9._]+)',
-            "Facebook": r'[fF][bB]:\s*@?([a-zA-Z0-9._]+)',
-            "YouTube": r'([yY][tT]|[yY]outube):\s*@?([a-zA-Z0-9._]+)',
-            "Telegram": r'[tT]elegram:\s*@?([a-zA-Z0-9._]+)',
-        }
+        if "DivShareLinks" in html and has_bio_url:
+            for div_match in _SHARE_LINKS_DIV_RE.finditer(html):
+                div_content = div_match.group(1)
+                div_links = _SHARE_LINKS_ANCHOR_RE.finditer(div_content)
+                for link_match in div_links:
+                    target = urllib.parse.unquote(link_match.group(1))
+                    link_text = link_match.group(2)
+                    entry = f"💎 **{link_text}**: `{target}`"
+                    if entry not in social_links:
+                        social_links.append(entry)
 
-        for label, pattern in social_patterns.items():
-            match = re.search(pattern, bio)
-            if match:
-                username = match.group(2) if len(match.groups()) > 1 else match.group(1)
-                prefix = "@" if label in {"Instagram", "Twitter/X", "Telegram"} else ""
+        bio = bio_text or ""
+        bio_matches: Dict[str, str] = {}
+        for match in _BIO_SOCIAL_RE.finditer(bio):
+            group = match.lastgroup
+            if group and group not in bio_matches:
+                bio_matches[group] = match.group(f"{group}_user")
+        for group, label, prefix in _BIO_SOCIAL_LABELS:
+            username = bio_matches.get(group)
+            if username:
                 entry = f"{label}: {prefix}{username}"
                 if entry not in social_links:
                     social_links.append(entry)
 
-        email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', bio)
+        email_match = _EMAIL_RE.search(bio)
         if email_match:
             entry = f"Email: {email_match.group(0)}"
             if entry not in social_links:
@@ -318,22 +598,30 @@ class TikTokScraper:
 
         headers = {"User-Agent": self.USER_AGENT}
 
-        response = self.session.get(url, headers=headers, timeout=15)
-        if response.status_code != 200:
-            raise TikTokScraperError(f"TikTok returned status {response.status_code}")
-
-        html_content = response.text
-
+        # A API é consultada nos dois caminhos; sobrepõe o RTT dela ao do HTML
+        api_future = _API_EXECUTOR.submit(self._fetch_user_info_via_api, identifier, headers)
         try:
-            soup = BeautifulSoup(html_content, "lxml")
-        except Exception:
-            soup = BeautifulSoup(html_content, "html.parser")
-
-        info = self._extract_patterns(html_content)
+            response = self.session.get(url, headers=headers, timeout=15)
+            if response.status_code != 200:
+                if response.status_code == 429:
+                    raise TikTokRateLimitError("TikTok returned status 429")
+                raise TikTokScraperError(f"TikTok returned status {response.status_code}")
+
+            # TikTok sempre serve UTF-8; fixar o encoding evita a detecção de charset
+            # (charset_normalizer) sobre a página inteira ao acessar .text
+            response.encoding = "utf-8"
+            html_content = response.text
+
+            # JSON embutido é a fonte principal; regex só quando o bloco não está presente
+            info = self._extract_rehydration_data(html_content) or self._extract_patterns(html_content)
+            api_info, api_links = api_future.result()
+        finally:
+            # Saída antecipada (status != 200, timeout/erro de conexão): não deixa a
+            # consulta à API na fila do executor. No caminho normal é um no-op.
+            api_future.cancel()
 
         # Fallback para API quando dados cruciais não aparecem no HTML
         if not info.get("user_id") or not info.get("unique_id"):
-            api_info, api_links = self._fetch_user_info_via_api(identifier, headers)
             if not api_info:
                 raise TikTokScraperError("Unable to extract TikTok profile information")
             info.update(api_info)
@@ -341,7 +629,6 @@ class TikTokScraper:
             source = "api"
         else:
             social_links = self._extract_social_links(html_content, info.get("signature", ""))
-            api_info, api_links = self._fetch_user_info_via_api(identifier, headers)
             info.update(api_info or {})
             social_links = _merge_social_links(social_links, api_links)
             source = "html"
@@ -382,7 +669,15 @@ class TikTokScraper:
     # ------------------------------------------------------------------
     # Conteúdo publicado
     # ------------------------------------------------------------------
-    def _normalize_post_item(self, item: Dict[str, Any], account_name: str) -> Dict[str, Any]:
+    def _normalize_post_item(
+        self,
+        item: Dict[str, Any],
+        account_name: str,
+        *,
+        permalink_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if permalink_prefix is None:
+            permalink_prefix = f"https://www.tiktok.com/@{account_name}/video/"
         stats = item.get("stats") or {}
         video_info = item.get("video") or {}
 
@@ -415,7 +710,7 @@ class TikTokScraper:
             "play_count": _safe_int(stats.get("playCount")),
             "collect_count": _safe_int(stats.get("collectCount")),
             "cover_url": cover_url,
-            "permalink": f"https://www.tiktok.com/@{account_name}/video/{item.get('id')}",
+            "permalink": f"{permalink_prefix}{item.get('id')}",
             "author": {
                 "nickname": author.get("nickname"),
                 "unique_id": author.get("uniqueId"),
@@ -433,6 +728,35 @@ class TikTokScraper:
             "is_pinned_item": bool(item.get("isPinnedItem")),
         }
 
+    def _normalize_post_items_bulk(self, items: Sequence[Dict[str, Any]], account_name: str) -> List[Dict[str, Any]]:
+        """Normaliza uma lista de posts montando o prefixo do permalink uma única vez."""
+        permalink_prefix = f"https://www.tiktok.com/@{account_name}/video/"
+        normalize = self._normalize_post_item
+        normalized: List[Dict[str, Any]] = []
+        append = normalized.append
+        for item in items:
+            try:
+                append(normalize(item, account_name, permalink_prefix=permalink_prefix))
+            except Exception as exc:  # pragma: no cover - falhas de parsing são ignoradas
+                logger.debug("Falha ao normalizar post TikTok %s: %s", item.get("id"), exc)
+        return normalized
+
+    def _account_session(self, cookie_jar: Optional[RequestsCookieJar]) -> requests.Session:
+        """
+        Sessão de curta duração para uma chamada com cookies de conta: cookie jar próprio
+        (o que o TikTok devolver não vaza para outras contas nem para self.session), mas
+        com os adapters de self.session, reaproveitando o pool keep-alive.
+
+        Não deve ser fechada: close() fecharia os adapters compartilhados.
+        """
+        session = requests.Session()
+        for prefix, adapter in getattr(self.session, "adapters", {}).items():
+            session.mount(prefix, adapter)
+        session.headers.update(self.session.headers)
+        if cookie_jar:
+            session.cookies.update(cookie_jar)
+        return session
+
     def _load_account_cookies(self, account_name: str) -> Tuple[Optional[RequestsCookieJar], Optional[str]]:
         """
         Carrega cookies salvos da conta para serem reutilizados em chamadas autenticadas.
@@ -441,11 +765,32 @@ class TikTokScraper:
         if not account_name:
             return None, None
 
-        storage = AccountStorage()
+        storage = _get_account_storage()
+        latest_file = storage.get_account_structure(account_name)["cookies"] / "cookies_latest.json"
+        try:
+            mtime_ns = latest_file.stat().st_mtime_ns
+        except OSError:
+            return None, None
+
+        # Reaproveita o jar já montado enquanto o arquivo de cookies não mudar
+        with _cookie_cache_lock:
+            cached = _cookie_cache.get(account_name)
+        if cached and cached[0] == mtime_ns:
+            return cached[1].copy(), cached[2]
+
         auth_bundle = storage.get_latest_cookies(account_name)
         if not auth_bundle:
             return None, None
 
+        jar, ms_token = self._parse_cookie_bundle(auth_bundle)
+        if jar is not None:
+            with _cookie_cache_lock:
+                _cookie_cache[account_name] = (mtime_ns, jar, ms_token)
+            jar = jar.copy()
+        return jar, ms_token
+
+    @staticmethod
+    def _parse_cookie_bundle(auth_bundle: Any) -> Tuple[Optional[RequestsCookieJar], Optional[str]]:
         cookies_data: Any = auth_bundle
         local_storage_data: Dict[str, Any] = {}
 
@@ -505,29 +850,40 @@ class TikTokScraper:
             return None
 
         try:
-            result = subprocess.run(
-                ["node", str(SIGNER_SCRIPT_PATH), url, self.USER_AGENT],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
+            return _SIGNER_WORKER.sign(url, self.USER_AGENT)
         except FileNotFoundError:
             logger.warning("Node.js não disponível para gerar X-Bogus.")
             return None
-        except subprocess.TimeoutExpired:
-            logger.warning("Geração do X-Bogus excedeu o tempo limite para %s", url)
-            return None
 
-        if result.returncode != 0:
-            stderr = (result.stderr or "").strip()
-            logger.debug("Falha ao gerar X-Bogus (rc=%s): %s", result.returncode, stderr)
-            return None
+    def _resolve_identity(self, identifier: str, headers: Dict[str, str]) -> Tuple[str, str, str]:
+        """
+        Resolve (sec_uid, unique_id, device_id) do perfil, com cache por identifier.
+        Evita a chamada prévia à API de usuário em buscas repetidas da mesma conta.
+        """
+        now = time.monotonic()
+        with _identity_cache_lock:
+            cached = _identity_cache.get(identifier)
+        if cached and now - cached[3] < _IDENTITY_CACHE_TTL:
+            return cached[0], cached[1], cached[2]
 
-        signature = (result.stdout or "").strip()
-        if not signature:
-            return None
-        return signature
+        profile_info, _ = self._fetch_user_info_via_api(identifier, headers)
+        if not profile_info or not profile_info.get("secUid"):
+            raise TikTokScraperError("Unable to resolve TikTok secUid for profile")
+
+        sec_uid = profile_info["secUid"]
+        unique_id = profile_info.get("unique_id", identifier)
+
+        # Garante consistência do device_id para não alterar assinatura com chamadas subsequentes
+        device_seed = hashlib.blake2b(unique_id.encode("utf-8"), digest_size=7).digest()
+        device_id = str(int.from_bytes(device_seed, "big"))
+
+        with _identity_cache_lock:
+            _identity_cache.pop(identifier, None)
+            if len(_identity_cache) >= _IDENTITY_CACHE_MAXSIZE:
+                # Descarta a entrada mais antiga (dict preserva ordem de inserção)
+                _identity_cache.pop(next(iter(_identity_cache)), None)
+            _identity_cache[identifier] = (sec_uid, unique_id, device_id, now)
+        return sec_uid, unique_id, device_id
 
     def fetch_recent_posts(self, identifier: str, *, count: int = 9, account_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -551,91 +907,43 @@ class TikTokScraper:
             "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
         }
 
-        profile_info, _ = self._fetch_user_info_via_api(identifier, headers)
-        if not profile_info or not profile_info.get("secUid"):
-            raise TikTokScraperError("Unable to resolve TikTok secUid for profile")
-
-        sec_uid = profile_info["secUid"]
-        unique_id = profile_info.get("unique_id", identifier)
+        sec_uid, unique_id, device_id = self._resolve_identity(identifier, headers)
         cookie_jar, ms_token = (None, None)
         if account_name:
             cookie_jar, ms_token = self._load_account_cookies(account_name)
 
-        # Garante consistência do device_id para não alterar assinatura com chamadas subsequentes
-        device_seed = hashlib.md5(unique_id.encode("utf-8")).hexdigest()
-        device_id = str(int(device_seed[:14], 16))
-
-        base_params: Dict[str, Any] = {
-            "aid": "1988",
-            "app_language": "pt-BR",
-            "app_name": "tiktok_web",
-            "browser_language": "pt-BR",
-            "browser_name": "Mozilla",
-            "browser_online": "true",
-            "browser_platform": "Win32",
-            "browser_version": self.USER_AGENT.split("Chrome/")[-1],
-            "channel": "tiktok_web",
-            "cookie_enabled": "true",
-            "count": str(min(max(count, 1), 30)),
-            "cursor": "0",
-            "device_id": device_id,
-            "device_platform": "web_pc",
-            "focus_state": "true",
-            "from_page": "user",
-            "history_len": "3",
-            "is_fullscreen": "false",
-            "is_page_visible": "true",
-            "language": "pt",
-            "os": "windows",
-            "priority_region": "",
-            "referer": "",
-            "region": "BR",
-            "screen_height": "1080",
-            "screen_width": "1920",
-            "tz_name": "America/Sao_Paulo",
-            "uniqueId": unique_id,
-            "secUid": sec_uid,
-        }
-
-        if ms_token:
-            base_params["msToken"] = ms_token
-        else:
+        if not ms_token:
             # Param obrigatório quando deslogado; usar token sintético re-gerado
-            base_params["msToken"] = "".join(random.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=107))
-
-        query_without_signature = urlencode(base_params)
+            # (80 bytes em base64 url-safe = 107 caracteres, mesmo formato do msToken real)
+            ms_token = secrets.token_urlsafe(80)
+
+        variable_params = (
+            ("count", str(min(max(count, 1), 30))),
+            ("device_id", device_id),
+            ("uniqueId", unique_id),
+            ("secUid", sec_uid),
+            ("msToken", ms_token),
+        )
+        query_without_signature = f"{_post_list_const_query(self.USER_AGENT)}&{urlencode(variable_params)}"
         url_for_signature = f"{API_POST_ITEM_LIST_URL}?{query_without_signature}"
         x_bogus = self._generate_x_bogus(url_for_signature)
         final_query = f"{query_without_signature}&X-Bogus={urllib.parse.quote_plus(x_bogus)}" if x_bogus else query_without_signature
         final_url = f"{API_POST_ITEM_LIST_URL}?{final_query}"
 
-        session = requests.Session()
-        session.headers.update(headers)
-        if cookie_jar:
-            session.cookies.update(cookie_jar)
-
         try:
-            response = session.get(final_url, timeout=15)
+            response = self._account_session(cookie_jar).get(final_url, headers=headers, timeout=15)
         except requests.RequestException as exc:
             raise TikTokScraperError(f"HTTP error contacting TikTok: {exc}") from exc
 
         if response.status_code != 200:
             raise TikTokScraperError(f"TikTok post list returned status {response.status_code}")
 
-        payload = response.json()
+        payload = _response_json(response)
         items = payload.get("itemList") or []
         if not items and payload.get("statusCode") not in (0, None):
             raise TikTokScraperError(f"TikTok API returned error: {payload.get('status_msg') or payload.get('statusCode')}")
 
-        normalized: List[Dict[str, Any]] = []
-        for item in items:
-            try:
-                normalized.append(self._normalize_post_item(item, unique_id))
-            except Exception as exc:  # pragma: no cover - falhas de parsing são ignoradas
-                logger.debug("Falha ao normalizar post TikTok %s: %s", item.get("id"), exc)
-                continue
-
-        return normalized
+        return self._normalize_post_items_bulk(items, unique_id)
 
 
 def capture_account_metrics(scraper: TikTokScraper, identifier: str) -> TikTokProfileData:
@@ -649,13 +957,8 @@ def capture_account_metrics(scraper: TikTokScraper, identifier: str) -> TikTokPr
         raise TikTokScraperError(str(exc)) from exc
 
 
-def refresh_account_metrics(db: Session, account: TikTokAccount) -> Tuple[TikTokAccountMetric, TikTokProfileData]:
-    """Coleta métricas do TikTok e persiste a última fotografia."""
-
-    scraper = TikTokScraper()
-    profile = capture_account_metrics(scraper, account.account_name)
-
-    record = TikTokAccountMetricsRepository.create(
+def _persist_account_metrics(db: Session, account: TikTokAccount, profile: TikTokProfileData) -> TikTokAccountMetric:
+    return TikTokAccountMetricsRepository.create(
         db,
         account_id=account.id,
         followers=profile.followers,
@@ -680,4 +983,11 @@ def refresh_account_metrics(db: Session, account: TikTokAccount) -> Tuple[TikTok
         },
     )
 
+
+def refresh_account_metrics(db: Session, account: TikTokAccount) -> Tuple[TikTokAccountMetric, TikTokProfileData]:
+    """Coleta métricas do TikTok e persiste a última fotografia."""
+
+    scraper = TikTokScraper()
+    profile = capture_account_metrics(scraper, account.account_name)
+    record = _persist_account_metrics(db, account, profile)
     return record, profile
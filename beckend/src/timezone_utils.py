@@ -5,37 +5,47 @@ Define timezone padrão como America/Sao_Paulo (Brasília) e fornece
 funções para trabalhar consistentemente com datas/horários.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
 import os
 
-# Importar ZoneInfo com fallback para Python < 3.9
+# Fábrica de timezone resolvida uma vez no import: zoneinfo (3.9+),
+# backports.zoneinfo ou pytz.timezone, sem classe intermediária
 try:
-    from zoneinfo import ZoneInfo
+    from zoneinfo import ZoneInfo as _tz_factory
 except ImportError:
     try:
-        from backports.zoneinfo import ZoneInfo  # type: ignore
+        from backports.zoneinfo import ZoneInfo as _tz_factory  # type: ignore
     except ImportError:
         # Fallback final usando pytz (mais comum)
-        import pytz
-        class ZoneInfo:  # type: ignore
-            def __new__(cls, key):
-                return pytz.timezone(key)
+        from pytz import timezone as _tz_factory  # type: ignore
 
 # Timezone padrão da aplicação (pode ser configurado via env)
 DEFAULT_TIMEZONE = os.getenv("TIMEZONE", "America/Sao_Paulo")
 
-def get_app_timezone() -> ZoneInfo:
+
+def _resolve_app_timezone() -> tzinfo:
+    try:
+        return _tz_factory(DEFAULT_TIMEZONE)
+    except Exception:
+        # Fallback para America/Sao_Paulo se timezone inválido
+        return _tz_factory("America/Sao_Paulo")
+
+
+# Resolvido uma única vez: DEFAULT_TIMEZONE só é lido no import
+_APP_TZ = _resolve_app_timezone()
+
+# Constante UTC usada pelos helpers de conversão
+UTC = timezone.utc
+
+
+def get_app_timezone() -> tzinfo:
     """
     Retorna o timezone configurado para a aplicação.
 
     Returns:
-        ZoneInfo: Objeto de timezone (ex: America/Sao_Paulo)
+        tzinfo: Objeto de timezone (ex: America/Sao_Paulo)
     """
-    try:
-        return ZoneInfo(DEFAULT_TIMEZONE)
-    except Exception:
-        # Fallback para America/Sao_Paulo se timezone inválido
-        return ZoneInfo("America/Sao_Paulo")
+    return _APP_TZ
 
 
 def now() -> datetime:
@@ -49,7 +59,7 @@ def now() -> datetime:
         >>> from src.timezone_utils import now
         >>> current_time = now()  # 2025-01-23 14:30:00-03:00 (horário de Brasília)
     """
-    return datetime.now(get_app_timezone())
+    return datetime.now(_APP_TZ)
 
 
 def utc_to_local(dt: datetime) -> datetime:
@@ -68,8 +78,8 @@ def utc_to_local(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         # Se não tem timezone, assume UTC
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(get_app_timezone())
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(_APP_TZ)
 
 
 def local_to_utc(dt: datetime) -> datetime:
@@ -88,8 +98,34 @@ def local_to_utc(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         # Se não tem timezone, assume timezone local
-        dt = dt.replace(tzinfo=get_app_timezone())
-    return dt.astimezone(timezone.utc)
+        dt = dt.replace(tzinfo=_APP_TZ)
+    # Destino UTC tem offset zero: basta subtrair o offset (uma consulta só)
+    offset = dt.utcoffset()
+    if offset is None:
+        return dt.astimezone(UTC)
+    return (dt - offset).replace(tzinfo=UTC)
+
+
+_dateutil_parser = None
+
+
+def _get_dateutil_parser():
+    """Importa dateutil.parser só no primeiro fallback e reaproveita o módulo."""
+    global _dateutil_parser
+    if _dateutil_parser is None:
+        from dateutil import parser
+        _dateutil_parser = parser
+    return _dateutil_parser
+
+
+def _looks_iso(dt_string: str) -> bool:
+    """Checagem barata do formato AAAA-MM-DD[T| ]... antes de tentar fromisoformat."""
+    return (
+        len(dt_string) >= 10
+        and dt_string[4] == '-'
+        and dt_string[7] == '-'
+        and (len(dt_string) == 10 or dt_string[10] in 'T ')
+    )
 
 
 def parse_datetime(dt_string: str) -> datetime:
@@ -106,26 +142,37 @@ def parse_datetime(dt_string: str) -> datetime:
         >>> dt = parse_datetime("2025-01-23T14:30:00")  # Assume timezone local
         >>> dt = parse_datetime("2025-01-23T14:30:00-03:00")  # Mantém timezone especificado
     """
-    # Parse da string
-    if dt_string.endswith('Z'):
+    # Strings fora do formato ISO vão direto ao dateutil, sem lançar ValueError antes
+    if not _looks_iso(dt_string):
+        dt = _get_dateutil_parser().parse(dt_string)
+    elif dt_string.endswith('Z'):
         # UTC timezone
-        dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+        dt = datetime.fromisoformat(dt_string[:-1] + '+00:00')
         return utc_to_local(dt)
-
-    try:
-        dt = datetime.fromisoformat(dt_string)
-    except ValueError:
-        # Tentar outros formatos
-        from dateutil import parser
-        dt = parser.parse(dt_string)
+    else:
+        try:
+            dt = datetime.fromisoformat(dt_string)
+        except ValueError:
+            # Formato parecido com ISO mas não aceito pelo fromisoformat
+            dt = _get_dateutil_parser().parse(dt_string)
 
     # Se não tem timezone, assume local
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=get_app_timezone())
+        dt = dt.replace(tzinfo=_APP_TZ)
 
     return dt
 
 
+# f-strings no lugar de strftime: mesmo resultado, sem reinterpretar o formato a cada chamada
+_FORMATTERS = {
+    "iso": datetime.isoformat,
+    "display": lambda dt: f"{dt.day:02d}/{dt.month:02d}/{dt.year:04d} {dt.hour:02d}:{dt.minute:02d}",
+    "db": lambda dt: (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    ),
+}
+
+
 def format_datetime(dt: datetime, format_type: str = "iso") -> str:
     """
     Formata datetime para string.
@@ -143,20 +190,18 @@ def format_datetime(dt: datetime, format_type: str = "iso") -> str:
         >>> format_datetime(dt, 'display')  # '23/01/2025 14:30'
         >>> format_datetime(dt, 'db')  # '2025-01-23 14:30:00'
     """
-    # Garantir que está no timezone local
+    # Garantir que está no timezone local (datetimes vindos de now() já estão)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=get_app_timezone())
-    else:
+        dt = dt.replace(tzinfo=_APP_TZ)
+    elif dt.tzinfo is not _APP_TZ:
         dt = utc_to_local(dt)
 
-    if format_type == "iso":
-        return dt.isoformat()
-    elif format_type == "display":
-        return dt.strftime("%d/%m/%Y %H:%M")
-    elif format_type == "db":
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    else:
-        return str(dt)
+    formatter = _FORMATTERS.get(format_type)
+    return formatter(dt) if formatter is not None else str(dt)
+
+
+# utcoffset -> string formatada; só muda entre transições de horário de verão
+_OFFSET_CACHE: dict = {}
 
 
 def get_timezone_offset() -> str:
@@ -169,10 +214,15 @@ def get_timezone_offset() -> str:
     Example:
         >>> get_timezone_offset()  # '-03:00' para America/Sao_Paulo
     """
-    dt = now()
-    offset = dt.strftime("%z")
-    # Formatar como -03:00 ao invés de -0300
-    return f"{offset[:-2]}:{offset[-2:]}"
+    offset = datetime.now(_APP_TZ).utcoffset()
+    cached = _OFFSET_CACHE.get(offset)
+    if cached is None:
+        # Formatar como -03:00 direto do timedelta, sem strftime + fatiamento
+        total_minutes = int(offset.total_seconds()) // 60
+        sign = "-" if total_minutes < 0 else "+"
+        hours, minutes = divmod(abs(total_minutes), 60)
+        cached = _OFFSET_CACHE[offset] = f"{sign}{hours:02d}:{minutes:02d}"
+    return cached
 
 
 def is_aware(dt: datetime) -> bool:
@@ -185,10 +235,16 @@ def is_aware(dt: datetime) -> bool:
     Returns:
         bool: True se tem timezone, False caso contrário
     """
-    return dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None
+    dt_tz = dt.tzinfo
+    if dt_tz is None:
+        return False
+    # Fast path: timezones conhecidos sempre têm offset, dispensa a consulta utcoffset()
+    if dt_tz is _APP_TZ or dt_tz is UTC:
+        return True
+    return dt_tz.utcoffset(dt) is not None
 
 
-def make_aware(dt: datetime, tz: ZoneInfo = None) -> datetime:
+def make_aware(dt: datetime, tz: tzinfo = None) -> datetime:
     """
     Adiciona timezone a datetime naive.
 
@@ -203,11 +259,11 @@ def make_aware(dt: datetime, tz: ZoneInfo = None) -> datetime:
         return dt
 
     if tz is None:
-        tz = get_app_timezone()
+        tz = _APP_TZ
 
     return dt.replace(tzinfo=tz)
 
 
 # Atalhos para facilitar uso
-tz = get_app_timezone()
+tz = _APP_TZ
 tz_offset = get_timezone_offset()
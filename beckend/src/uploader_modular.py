@@ -8,9 +8,14 @@ MUDANÇAS:
 - Fácil manutenção e testes individuais por módulo
 - Separação clara de responsabilidades
 """
+import logging
 import os
 import time
-from typing import Optional
+from functools import cached_property
+from typing import Callable, Dict, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 
 # Importa módulos especializados
 from .modules.video_upload import VideoUploadModule
@@ -25,6 +30,22 @@ from .modules.post_confirmation import (
 from .modules.file_manager import FileManagerModule
 from .modules.duplicate_protection import DuplicateProtectionModule
 
+# Espera de estabilização pós-publicação: termina no primeiro sinal do quick_check
+UI_SETTLE_TIMEOUT = 5
+UI_SETTLE_POLL = 0.25
+
+# Módulos com estado da página (cache de campo, sinais, locks) e seus métodos opcionais:
+# recriados a cada post_video
+_PER_RUN_MODULES = (
+    "upload_module",
+    "description_module",
+    "audience_module",
+    "post_action_module",
+    "confirmation_module",
+    "duplicate_protection",
+    "_run_hooks",
+)
+
 
 class TikTokUploader:
     """
@@ -65,20 +86,64 @@ class TikTokUploader:
         """
         self.driver = driver
         self.log = logger.info if logger and hasattr(logger, 'info') else (logger if logger else print)
+        # Só loggers do módulo logging filtram por nível; callables e print sempre logam
+        self._is_enabled_for = getattr(logger, "isEnabledFor", None)
         self.account_name = account_name
 
-        # Inicializa módulos
-        self.upload_module = VideoUploadModule(driver, logger=self.log)
-        self.description_module = DescriptionModule(driver, logger=self.log)
-        self.audience_module = AudienceModule(driver, logger=self.log)
-        self.post_action_module = PostActionModule(driver, logger=self.log)
-        self.confirmation_module = PostConfirmationModule(driver, logger=self.log)
-        self.file_manager = FileManagerModule(logger=self.log)
-        self.duplicate_protection = DuplicateProtectionModule(logger=self.log)
+        # Módulos são construídos no primeiro uso (cached_property abaixo)
 
         # Compatibilidade com código antigo
         self._file_input_context = None
 
+    # ===================== MÓDULOS (sob demanda) =====================
+
+    @cached_property
+    def upload_module(self) -> VideoUploadModule:
+        return VideoUploadModule(self.driver, logger=self.log)
+
+    @cached_property
+    def description_module(self) -> DescriptionModule:
+        return DescriptionModule(self.driver, logger=self.log)
+
+    @cached_property
+    def audience_module(self) -> AudienceModule:
+        return AudienceModule(self.driver, logger=self.log)
+
+    @cached_property
+    def post_action_module(self) -> PostActionModule:
+        return PostActionModule(self.driver, logger=self.log)
+
+    @cached_property
+    def confirmation_module(self) -> PostConfirmationModule:
+        return PostConfirmationModule(self.driver, logger=self.log)
+
+    @cached_property
+    def file_manager(self) -> FileManagerModule:
+        return FileManagerModule(logger=self.log)
+
+    @cached_property
+    def duplicate_protection(self) -> DuplicateProtectionModule:
+        return DuplicateProtectionModule(logger=self.log)
+
+    @cached_property
+    def _run_hooks(self) -> Dict[str, Optional[Callable]]:
+        """Métodos opcionais dos módulos da execução, resolvidos uma vez (None se ausentes)."""
+        post_action = self.post_action_module
+        confirmation = self.confirmation_module
+        return {
+            "publish_and_confirm": getattr(post_action, "publish_and_confirm", None),
+            "detect_violation": getattr(post_action, "detect_content_violation", None),
+            "is_on_upload": getattr(post_action, "is_on_upload_page", None),
+            "page_state": getattr(confirmation, "page_state", None),
+            "quick_check": getattr(confirmation, "quick_check", None),
+            "confirm_posted": getattr(confirmation, "confirm_posted", None),
+        }
+
+    def _reset_run_modules(self) -> None:
+        """Descarta os módulos da execução anterior; o próximo acesso cria instâncias novas."""
+        for name in _PER_RUN_MODULES:
+            self.__dict__.pop(name, None)
+
     # ===================== MÉTODOS PÚBLICOS (Interface Compatível) =====================
 
     def go_to_upload(self) -> bool:
@@ -112,6 +177,37 @@ class TikTokUploader:
         """
         return self.confirmation_module.wait_for_confirmation(timeout=CONFIRMATION_TIMEOUT)
 
+    def _wait_ui_settle(self) -> None:
+        """Espera o quick_check da confirmação (poll de 250ms) em vez de um sleep fixo."""
+        quick_check = self._run_hooks["quick_check"]
+        if quick_check is None:
+            return
+        start = time.monotonic()
+        try:
+            WebDriverWait(self.driver, UI_SETTLE_TIMEOUT, poll_frequency=UI_SETTLE_POLL).until(
+                lambda _driver: quick_check()
+            )
+            self.log(f"⚡ Sinal de postagem em {time.monotonic() - start:.1f}s")
+        except TimeoutException:
+            pass
+
+    def _probe_post_state(self) -> Dict[str, bool]:
+        """
+        Estado pós-clique numa única leitura da página (URL + botão Post).
+        Cai para is_on_upload_page() se a confirmação não expuser page_state.
+        """
+        hooks = self._run_hooks
+        state = hooks["page_state"]() if hooks["page_state"] else None
+        if state is not None:
+            return {"on_upload": bool(state["on_upload"]), "confirmed": bool(state["confirmed"])}
+        on_upload = hooks["is_on_upload"] and hooks["is_on_upload"]()
+        return {"on_upload": bool(on_upload), "confirmed": False}
+
+    def _step(self, n, msg: str) -> None:
+        """Marcador de etapa do post_video; não formata nada se INFO estiver desligado."""
+        if self._is_enabled_for is None or self._is_enabled_for(logging.INFO):
+            self.log(f"🔹 Etapa {n}/7: {msg}")
+
     # ===================== MÉTODO PRINCIPAL =====================
 
     def post_video(self, video_path: str, description: str = "", posted_dir: Optional[str] = None) -> bool:
@@ -127,11 +223,13 @@ class TikTokUploader:
             True se publicou, False caso contrário
         """
         self.log(f"📹 Iniciando publicação: {os.path.basename(video_path)}")
+        # Sem herdar cache de campo/sinais da postagem anterior
+        self._reset_run_modules()
         if not posted_dir:
             posted_dir = "./posted"
 
         # MÓDULO 0: Proteção contra Duplicatas (VERIFICAÇÃO PRÉVIA)
-        self.log("🔹 Etapa 0/7: Verificação de duplicatas")
+        self._step(0, "Verificação de duplicatas")
         can_post, reason = self.duplicate_protection.can_post_video(video_path, posted_dir)
         if not can_post:
             self.log(f"❌ Vídeo bloqueado: {reason}")
@@ -144,7 +242,7 @@ class TikTokUploader:
 
         try:
             # MÓDULO 1: Upload e Validação
-            self.log("🔹 Etapa 1/7: Upload do vídeo")
+            self._step(1, "Upload do vídeo")
             if not self.go_to_upload():
                 self.log("❌ Falha ao acessar página de upload")
                 self.duplicate_protection.remove_posting_lock(video_path)
@@ -158,55 +256,62 @@ class TikTokUploader:
                     return False
 
             # MÓDULO 2: Tratamento da Descrição
-            self.log("🔹 Etapa 2/7: Preenchimento da descrição")
+            self._step(2, "Preenchimento da descrição")
             if description:
                 self.fill_description(description)
             else:
                 self.log("ℹ️ Sem descrição fornecida")
 
             # MÓDULO 3: Seleção de Audiência
-            self.log("🔹 Etapa 3/7: Configuração de audiência")
+            self._step(3, "Configuração de audiência")
             self.set_audience_public()
 
-            # MÓDULO 4: Ação de Postagem
-            self.log("🔹 Etapa 4/7: Publicação")
-            if not self.click_publish():
+            # MÓDULO 4 + 4.5: Ação de Postagem e Gerenciamento de Modais
+            self._step(4, "Publicação + modais")
+            hooks = self._run_hooks
+            if hooks["publish_and_confirm"]:
+                # Clique + confirmação numa única chamada ao navegador
+                published = hooks["publish_and_confirm"]()
+            else:
+                published = self.click_publish()
+                if published:
+                    self.handle_confirmation_dialog()
+            if not published:
                 self.log("❌ Falha ao clicar em publicar")
                 self.duplicate_protection.remove_posting_lock(video_path)
                 return False
 
-            # MÓDULO 4.5: Gerenciamento de Modais
-            self.log("🔹 Etapa 4.5/7: Gerenciamento de modais")
-            self.handle_confirmation_dialog()
-
             # MÓDULO 4.6: Detecção de Violações
-            self.log("🔹 Etapa 4.6/7: Verificação de violações")
-            if hasattr(self.post_action_module, "detect_content_violation") and self.post_action_module.detect_content_violation():
+            self._step(4.6, "Verificação de violações")
+            if hooks["detect_violation"] and hooks["detect_violation"]():
                 self.log("❌ Vídeo rejeitado por violação de conteúdo")
                 self.duplicate_protection.remove_posting_lock(video_path)
                 return False
 
-            # MÓDULO 4.7: Retry se ainda estiver na tela de upload
-            if hasattr(self.post_action_module, "is_on_upload_page") and self.post_action_module.is_on_upload_page():
+            # MÓDULO 4.7: Retry se ainda estiver na tela de upload com o botão Post visível
+            state = self._probe_post_state()
+            if state["on_upload"] and not state["confirmed"]:
                 self.log("🔁 Ainda na página de upload, tentando publicar novamente...")
                 if self.click_publish():
                     self.log("✅ Segundo clique em publicar executado")
                     self.handle_confirmation_dialog()
 
-            # Pequeno buffer de estabilidade da UI
-            self.log("⏳ Aguardando confirmação final do TikTok...")
-            time.sleep(5)
+            # Buffer de estabilidade da UI: até UI_SETTLE_TIMEOUT, mas sai no primeiro sinal
+            if not state["confirmed"]:
+                self.log("⏳ Aguardando confirmação final do TikTok...")
+                self._wait_ui_settle()
 
             # MÓDULO 5: Confirmação de Postagem (ESTRITA)
-            self.log("🔹 Etapa 5/7: Confirmação de postagem")
+            self._step(5, "Confirmação de postagem")
             # Usa API nova (ConfirmationResult). Se não existir, cai para o wrapper bool.
             result = None
-            if hasattr(self.confirmation_module, "confirm_posted"):
+            confirm_posted = hooks["confirm_posted"]
+            if confirm_posted:
                 try:
-                    result = self.confirmation_module.confirm_posted(timeout=CONFIRMATION_TIMEOUT, strict=True, quick_check=False)
+                    result = confirm_posted(timeout=CONFIRMATION_TIMEOUT, strict=True, quick_check=False)
                 except TypeError:
                     # Versões antigas podem ter assinatura diferente
-                    result = self.confirmation_module.confirm_posted(timeout=CONFIRMATION_TIMEOUT)
+                    result = confirm_posted(timeout=CONFIRMATION_TIMEOUT)
             # Fallback legacy
             if result is None or not hasattr(result, "status"):
                 ok_bool = self.confirmation_module.wait_for_confirmation(timeout=CONFIRMATION_TIMEOUT)
@@ -221,7 +326,7 @@ class TikTokUploader:
                 self.log("🎉 Vídeo publicado com sucesso!")
 
                 # MÓDULO 6: Marca como postado e remove lock
-                self.log("🔹 Etapa 6/7: Finalização")
+                self._step(6, "Finalização")
                 self.duplicate_protection.finalize_post_operation(
                     video_path=video_path,
                     success=True,
@@ -294,17 +399,11 @@ class TikTokUploader:
         """Compatibilidade: método do módulo de ação"""
         return self.post_action_module._wait_clickable
 
-    @staticmethod
-    def _normalize_text(text: str) -> str:
-        """Compatibilidade: normalização de texto"""
-        from .modules.video_upload import VideoUploadModule
-        return VideoUploadModule._normalize_text(text)
-
-    @staticmethod
-    def _shorten_text(text: str) -> str:
-        """Compatibilidade: encurtamento de texto"""
-        from .modules.video_upload import VideoUploadModule
-        return VideoUploadModule._shorten_text(text)
+    # Compatibilidade: normalização de texto (VideoUploadModule já importado no topo)
+    _normalize_text = staticmethod(VideoUploadModule._normalize_text)
+
+    # Compatibilidade: encurtamento de texto (VideoUploadModule já importado no topo)
+    _shorten_text = staticmethod(VideoUploadModule._shorten_text)
 
 
 # ===================== FUNÇÃO FACTORY =====================
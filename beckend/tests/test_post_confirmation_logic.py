@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.modules.post_confirmation import (
+    PostConfirmationModule,
+    _HARD_SUCCESS_RE,
+    _SUBMITTED_RE,
+)
+
+
+def _norm(text):
+    return PostConfirmationModule._normalize_text(text)
+
+
+def test_accented_keywords_match_normalized_text():
+    assert _HARD_SUCCESS_RE.search(_norm("Vídeo publicado!"))
+    assert _SUBMITTED_RE.search(_norm("Verificação em andamento..."))
+
+
+def test_keyword_regex_ignores_unrelated_text():
+    assert _HARD_SUCCESS_RE.search(_norm("Uploading 45%")) is None
+    assert _SUBMITTED_RE.search(_norm("Video posted successfully")) is None
+
+
+def test_classification_is_reused_for_unchanged_texts():
+    module = PostConfirmationModule(driver=None, logger=lambda *_: None)
+
+    first = module._classify_status_texts(["Uploading 45%"], "body")
+    assert first[0] == ["Uploading 45%"]
+    assert module._classify_status_texts(["Uploading 45%"], "body") is first
+
+    changed = module._classify_status_texts(["Video published"], "body")
+    assert changed is not first
+    assert changed[2] == "Video published"
+
+
+class _Button:
+    def __init__(self, displayed, stale=False):
+        self.displayed = displayed
+        self.stale = stale
+
+    def is_displayed(self):
+        if self.stale:
+            raise StaleElementReferenceException("re-render")
+        return self.displayed
+
+
+class _ButtonDriver:
+    class _SwitchTo:
+        def default_content(self):
+            pass
+
+    def __init__(self, *rounds):
+        self.rounds = list(rounds)
+        self.switch_to = self._SwitchTo()
+
+    def find_elements(self, *_):
+        return self.rounds.pop(0)
+
+
+def test_publish_button_check_refinds_after_stale_element():
+    driver = _ButtonDriver([_Button(True, stale=True)], [_Button(True)])
+    module = PostConfirmationModule(driver=driver, logger=lambda *_: None)
+    assert module.check_publish_button_disappeared() is False
+    assert driver.rounds == []
+
+    driver = _ButtonDriver([_Button(True, stale=True)], [])
+    module = PostConfirmationModule(driver=driver, logger=lambda *_: None)
+    assert module.check_publish_button_disappeared() is True
@@ -1,4 +1,5 @@
 import threading
+import time
 from types import SimpleNamespace
 from typing import Dict
 import sys
@@ -118,3 +119,29 @@ def test_fetch_active_accounts_handles_errors(monkeypatch):
     daemon = daemon_module.SchedulerDaemon()
     accounts = daemon._fetch_active_accounts()
     assert accounts == []
+
+
+def test_stop_wakes_run_loop_immediately(monkeypatch, fake_repo, fake_scheduler_cls):
+    monkeypatch.setattr(daemon_module, "_log", lambda *args, **kwargs: None)
+    daemon = daemon_module.SchedulerDaemon(poll_interval=60)
+    daemon.start()
+
+    started = time.monotonic()
+    daemon.stop()
+    assert time.monotonic() - started < 5
+    assert daemon._schedulers == {}
+
+
+def test_stop_all_schedulers_runs_in_parallel(monkeypatch, fake_repo, fake_scheduler_cls):
+    monkeypatch.setattr(daemon_module, "_log", lambda *args, **kwargs: None)
+    daemon = daemon_module.SchedulerDaemon(poll_interval=1)
+    fake_repo.update({"acc3", "acc4"})
+    daemon._sync_accounts()
+
+    barrier = threading.Barrier(len(fake_repo), timeout=5)
+    for sched in fake_scheduler_cls.values():
+        sched.stop = barrier.wait
+
+    daemon._stop_all_schedulers()
+    assert daemon._schedulers == {}
+    assert not barrier.broken
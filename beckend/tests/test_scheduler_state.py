@@ -0,0 +1,55 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import src.scheduler_state as state_module
+
+
+@pytest.fixture()
+def state(tmp_path, monkeypatch):
+    state_file = tmp_path / "scheduler_state.json"
+    monkeypatch.setattr(state_module, "STATE_FILE", state_file)
+    monkeypatch.setattr(state_module, "_state_cache", {})
+    monkeypatch.setattr(state_module, "_cache_signature", None)
+    return state_module
+
+
+def test_update_state_merges_fields(state):
+    state.update_state("acc1", status="running", due_count=2)
+    state.update_state("acc1", message="ok")
+
+    entry = state.get_state("acc1")["acc1"]
+    assert entry["status"] == "running"
+    assert entry["due_count"] == 2
+    assert entry["message"] == "ok"
+    assert entry["next_due_at"] is None
+    assert "updated_at" in entry
+
+
+def test_update_state_persists_and_clear_removes(state):
+    state.update_state("acc1", status="idle")
+    state.update_state("acc2", status="running")
+    state.clear_state("acc1")
+
+    saved = json.loads(state.STATE_FILE.read_text(encoding="utf-8"))
+    assert set(saved) == {"acc2"}
+    assert state.get_state() == saved
+
+
+def test_get_state_picks_up_external_writes(state):
+    state.update_state("acc1", status="idle")
+    assert set(state.get_state()) == {"acc1"}
+
+    # Outro processo (ex.: o scheduler) regrava o arquivo
+    state.STATE_FILE.write_text(json.dumps({"acc9": {"account_name": "acc9"}}), encoding="utf-8")
+    assert set(state.get_state()) == {"acc9"}
+
+    state.update_state("acc9", status="running")
+    saved = json.loads(state.STATE_FILE.read_text(encoding="utf-8"))
+    assert saved["acc9"]["status"] == "running"
@@ -122,3 +122,20 @@ def test_post_video_instantiates_fresh_modules_each_run(monkeypatch):
     assert counts["confirmation"] == 2
     assert counts["duplicate"] == 2
     assert counts["finalize"] == 2
+
+
+def test_step_markers_respect_logger_level():
+    import logging
+
+    logger = logging.getLogger("test-uploader-steps")
+    logger.setLevel(logging.WARNING)
+    calls = []
+    uploader = TikTokUploader(driver=object(), logger=logger)
+    uploader.log = calls.append
+
+    uploader._step(1, "Upload do vídeo")
+    assert calls == []
+
+    logger.setLevel(logging.INFO)
+    uploader._step(4.6, "Verificação de violações")
+    assert calls == ["🔹 Etapa 4.6/7: Verificação de violações"]
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from src.cookies import _clean_cookie, _clear_browser_cookies, _set_cookies_via_cdp
+
+
+class _CdpDriver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        if self.fail:
+            raise RuntimeError("cdp indisponível")
+        return {}
+
+
+def test_set_cookies_via_cdp_sends_one_batch():
+    driver = _CdpDriver()
+    cookies = [
+        {"name": "sessionid", "value": "abc", "domain": ".tiktok.com", "path": "/",
+         "secure": True, "httpOnly": True, "sameSite": "Lax", "expiry": 123},
+        {"name": "msToken", "value": 42, "sameSite": "no_restriction"},
+        {"value": "sem nome"},
+    ]
+
+    added = _set_cookies_via_cdp(driver, cookies, "https://www.tiktok.com")
+
+    assert added == 2
+    assert driver.commands == [(
+        "Network.setCookies",
+        {"cookies": [
+            {"name": "sessionid", "value": "abc", "domain": ".tiktok.com", "path": "/",
+             "secure": True, "httpOnly": True, "expires": 123, "sameSite": "Lax"},
+            {"name": "msToken", "value": "42", "url": "https://www.tiktok.com"},
+        ]},
+    )]
+
+
+def test_set_cookies_via_cdp_signals_fallback():
+    assert _set_cookies_via_cdp(object(), [{"name": "a", "value": "b"}], "https://x") is None
+    assert _set_cookies_via_cdp(_CdpDriver(fail=True), [{"name": "a", "value": "b"}], "https://x") is None
+    assert _clean_cookie({"name": "a", "sameSite": "Lax", "expiry": 1}) == {"name": "a"}
+
+
+def test_clear_browser_cookies_works_on_blank_page():
+    driver = _CdpDriver()
+    assert _clear_browser_cookies(driver, on_http_page=False) is True
+    assert driver.commands == [("Network.clearBrowserCookies", {})]
+
+    assert _clear_browser_cookies(_CdpDriver(fail=True), on_http_page=False) is False
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from selenium.common.exceptions import TimeoutException
+
+from src.modules.post_action import POST_CLICKED_JS, PostActionModule
+
+
+class _CascadeDriver:
+    def __init__(self, clicked):
+        self.clicked = clicked
+
+    def execute_async_script(self, *_):
+        raise TimeoutException("script timeout")
+
+    def execute_script(self, script, *_):
+        if script == POST_CLICKED_JS:
+            return self.clicked
+        return None
+
+
+def _module(driver, calls):
+    module = PostActionModule(driver, logger=lambda *_: None)
+    module.click_publish_button = lambda: calls.append("click") or True
+    module.handle_confirmation_dialog = lambda: calls.append("confirm") or True
+    return module
+
+
+def test_publish_and_confirm_does_not_reclick_after_script_error():
+    calls = []
+    assert _module(_CascadeDriver(clicked=True), calls).publish_and_confirm() is True
+    assert calls == ["confirm"]
+
+
+def test_publish_and_confirm_falls_back_when_script_never_clicked():
+    calls = []
+    assert _module(_CascadeDriver(clicked=False), calls).publish_and_confirm() is True
+    assert calls == ["click", "confirm"]
@@ -0,0 +1,31 @@
+import queue
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from src.modules._selenium_utils import write_bytes_async
+
+
+def test_write_bytes_async_logs_after_write(tmp_path):
+    messages = queue.Queue()
+    target = tmp_path / "shot.png"
+
+    write_bytes_async(str(target), b"png", messages.put, "Screenshot")
+
+    assert messages.get(timeout=2) == f"📸 Screenshot salvo: {target}"
+    assert target.read_bytes() == b"png"
+
+
+def test_write_bytes_async_reports_failed_write(tmp_path):
+    messages = queue.Queue()
+    target = tmp_path / "missing" / "shot.png"
+
+    write_bytes_async(str(target), b"png", messages.put, "Screenshot")
+
+    assert messages.get(timeout=2).startswith(f"⚠️ Falha ao salvar Screenshot: {target}")
@@ -0,0 +1,364 @@
+import json
+import subprocess
+import sys
+import time
+from http.client import HTTPMessage
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import src.services.tiktok_scraper as scraper_module
+from src.services.tiktok_scraper import TikTokScraper
+
+
+PROFILE_HTML = (
+    '<html><script>{"webapp.user-detail":{"userInfo":{"user":{"id":"6789",'
+    '"uniqueId":"creator","nickname":"Creator","avatarLarger":"https:\\u002F\\u002Fcdn\\u002Fa.jpg",'
+    '"signature":"ig: @creator.ig\\nfale: contato@creator.com","verified":true,'
+    '"secUid":"MS4wLjABAAAA","privateAccount":false,"ttSeller":false,"region":"BR",'
+    '"commentSetting":0,"bioLink":{"link":"linktr.ee\\u002Fcreator","risk":0}},'
+    '"stats":{"followerCount":1200,"followingCount":15,"heartCount":9000,'
+    '"videoCount":42,"diggCount":7,"heart":9000,"friendCount":3}}}}</script>'
+    '<span class="css-x-SpanLink e1">creator.site</span></html>'
+)
+
+
+def test_extract_patterns_reads_profile_fields():
+    info = TikTokScraper._extract_patterns(PROFILE_HTML)
+
+    assert info["user_id"] == "6789"
+    assert info["unique_id"] == "creator"
+    assert info["nickname"] == "Creator"
+    assert info["followers"] == "1200"
+    assert info["following"] == "15"
+    assert info["likes"] == "9000"
+    assert info["videos"] == "42"
+    assert info["verified"] == "true"
+    assert info["privateAccount"] == "false"
+    assert info["secUid"] == "MS4wLjABAAAA"
+    assert info["region"] == "BR"
+    assert info["friendCount"] == "3"
+
+
+def test_extract_patterns_returns_empty_without_profile_data():
+    assert TikTokScraper._extract_patterns("<html></html>") == {}
+
+
+def test_extract_social_links_collects_html_and_bio_entries():
+    links = TikTokScraper._extract_social_links(
+        PROFILE_HTML, "ig: @creator.ig\nfale: contato@creator.com"
+    )
+
+    assert "Link: creator.site - creator.site" in links
+    assert "💎 **linktr.ee/creator**: `linktr.ee/creator`" in links
+    assert "Instagram: @creator.ig" in links
+    assert "Email: contato@creator.com" in links
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, text="", payload=None):
+        self.status_code = status_code
+        self.text = text
+        self._payload = payload or {}
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, html, api_payload):
+        self.headers = {}
+        self.calls = []
+        self._html = html
+        self._api_payload = api_payload
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        if "/api/user/detail/" in url:
+            return _FakeResponse(payload=self._api_payload)
+        return _FakeResponse(text=self._html)
+
+
+def test_fetch_profile_merges_html_and_api_data():
+    api_payload = {
+        "userInfo": {
+            "user": {
+                "id": "6789",
+                "uniqueId": "creator",
+                "nickname": "Creator API",
+                "secUid": "MS4wLjABAAAA",
+                "bioLink": {"link": "https:\\u002F\\u002Fcreator.site"},
+            },
+            "stats": {"followerCount": 1300, "videoCount": 43},
+        }
+    }
+    session = _FakeSession(PROFILE_HTML, api_payload)
+
+    profile = TikTokScraper(session=session).fetch_profile("@creator")
+
+    assert profile.source == "html"
+    assert profile.user_id == "6789"
+    assert profile.nickname == "Creator API"
+    assert profile.followers == 1300
+    assert profile.videos == 43
+    assert "Link: https://creator.site - https://creator.site" in profile.social_links
+    assert len(session.calls) == 2
+
+
+def test_fetch_profile_falls_back_to_api_when_html_is_empty():
+    api_payload = {"userInfo": {"user": {"id": "1", "uniqueId": "solo"}, "stats": {}}}
+    session = _FakeSession("<html></html>", api_payload)
+
+    profile = TikTokScraper(session=session).fetch_profile("solo")
+
+    assert profile.source == "api"
+    assert profile.unique_id == "solo"
+
+
+def test_fetch_profile_cancels_api_lookup_when_html_request_fails(monkeypatch):
+    class _Future:
+        cancelled = False
+
+        def cancel(self):
+            self.cancelled = True
+            return True
+
+    future = _Future()
+    monkeypatch.setattr(scraper_module._API_EXECUTOR, "submit", lambda *args, **kwargs: future)
+
+    class _TimeoutSession(_FakeSession):
+        def get(self, url, **kwargs):
+            raise requests.Timeout("html timeout")
+
+    with pytest.raises(requests.Timeout):
+        TikTokScraper(session=_TimeoutSession("", {})).fetch_profile("creator")
+    assert future.cancelled
+
+
+class _RecordingAdapter(BaseAdapter):
+    """Adapter HTTP falso: responde JSON por trecho de URL e grava os requests enviados."""
+
+    def __init__(self, routes, set_cookie=None):
+        super().__init__()
+        self.routes = routes
+        self.set_cookie = set_cookie
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        payload = next((body for fragment, body in self.routes.items() if fragment in request.url), {})
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(payload).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        msg = HTTPMessage()
+        if self.set_cookie:
+            msg["Set-Cookie"] = self.set_cookie
+        response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=msg))
+        return response
+
+    def close(self):
+        pass
+
+
+def _adapter_session(adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+POSTS_PAYLOAD = {
+    "statusCode": 0,
+    "itemList": [{"id": "111", "desc": "oi", "createTime": 0, "stats": {"playCount": 10}}],
+}
+
+
+def test_fetch_recent_posts_caches_identity(monkeypatch):
+    monkeypatch.setattr(scraper_module, "_identity_cache", {})
+    monkeypatch.setattr(TikTokScraper, "_generate_x_bogus", lambda self, url: None)
+
+    api_payload = {"userInfo": {"user": {"id": "1", "uniqueId": "creator", "secUid": "SEC"}, "stats": {}}}
+    adapter = _RecordingAdapter({"/api/user/detail/": api_payload, "/api/post/item_list/": POSTS_PAYLOAD})
+    session = _adapter_session(adapter)
+    scraper = TikTokScraper(session=session)
+
+    first = scraper.fetch_recent_posts("@creator")
+    second = TikTokScraper(session=session).fetch_recent_posts("creator")
+
+    assert first == second
+    assert first[0]["permalink"] == "https://www.tiktok.com/@creator/video/111"
+    assert first[0]["play_count"] == 10
+    urls = [request.url for request in adapter.sent]
+    assert len([url for url in urls if "/api/user/detail/" in url]) == 1
+    assert "secUid=SEC" in urls[-1]
+
+
+def test_fetch_recent_posts_does_not_leak_cookies_between_accounts(monkeypatch):
+    monkeypatch.setattr(TikTokScraper, "_generate_x_bogus", lambda self, url: None)
+    monkeypatch.setattr(TikTokScraper, "_resolve_identity", lambda self, identifier, headers: ("SEC", identifier, "1"))
+
+    def fake_cookies(self, account_name):
+        jar = requests.cookies.RequestsCookieJar()
+        jar.set("sessionid", f"sid-{account_name}", domain=".tiktok.com", path="/")
+        return jar, f"tok-{account_name}"
+
+    monkeypatch.setattr(TikTokScraper, "_load_account_cookies", fake_cookies)
+
+    adapter = _RecordingAdapter(
+        {"/api/post/item_list/": POSTS_PAYLOAD},
+        set_cookie="ttwid=from-first; Domain=.tiktok.com; Path=/",
+    )
+    scraper = TikTokScraper(session=_adapter_session(adapter))
+
+    scraper.fetch_recent_posts("creator", account_name="first")
+    scraper.fetch_recent_posts("creator", account_name="second")
+
+    first_cookies = adapter.sent[0].headers.get("Cookie", "")
+    second_cookies = adapter.sent[1].headers.get("Cookie", "")
+    assert "sessionid=sid-first" in first_cookies
+    assert second_cookies == "sessionid=sid-second"
+    assert len(scraper.session.cookies) == 0
+
+
+def test_extract_rehydration_data_reads_embedded_json():
+    payload = {
+        "__DEFAULT_SCOPE__": {
+            "webapp.user-detail": {
+                "userInfo": {
+                    "user": {"id": "6789", "uniqueId": "creator", "verified": True, "signature": "ig: @c\nbio"},
+                    "stats": {"followerCount": 1200, "videoCount": 42},
+                }
+            }
+        }
+    }
+    html = (
+        '<html><script id="__UNIVERSAL_DATA_FOR_REHYDRATION__" type="application/json">'
+        + json.dumps(payload)
+        + "</script></html>"
+    )
+
+    info = TikTokScraper._extract_rehydration_data(html)
+
+    assert info == {
+        "user_id": "6789",
+        "unique_id": "creator",
+        "verified": True,
+        "signature": "ig: @c\nbio",
+        "followers": 1200,
+        "videos": 42,
+    }
+    assert TikTokScraper._extract_rehydration_data(PROFILE_HTML) == {}
+
+
+def test_extract_social_links_reads_bio_url_redirects():
+    html = (
+        '<a href="https://www.tiktok.com/link/v2?aid=1988&scene=bio_url&target=https%3A%2F%2Fshop.example">'
+        '<span class="css-1-SpanLink">shop.example</span></a>'
+    )
+
+    links = TikTokScraper._extract_social_links(html, "")
+
+    assert links[0] == "Link: shop.example - https://shop.example"
+    assert TikTokScraper._extract_social_links("<html></html>", "") == []
+
+
+def test_merge_social_links_dedupes_in_order():
+    from src.services.tiktok_scraper import _merge_social_links
+
+    merged = _merge_social_links([" a ", "b"], None, ["a", "", "c ", "b"])
+
+    assert merged == ["a", "b", "c"]
+
+
+def test_load_account_cookies_reuses_jar_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from src.account_storage import AccountStorage
+
+    storage = AccountStorage(base_dir=tmp_path)
+    monkeypatch.setattr(storage, "userdata_dir", tmp_path / "user_data")
+    monkeypatch.setattr(scraper_module, "_account_storage", storage)
+    monkeypatch.setattr(scraper_module, "_cookie_cache", {})
+
+    cookies_file = tmp_path / "user_data" / "acc" / "cookies" / "cookies_latest.json"
+    cookies_file.parent.mkdir(parents=True)
+    cookies_file.write_text(json.dumps({"cookies": {"sessionid": "s1", "msToken": "tok1"}}), encoding="utf-8")
+
+    reads = []
+    original = AccountStorage.get_latest_cookies
+
+    def counting_get_latest_cookies(self, account_name):
+        reads.append(account_name)
+        return original(self, account_name)
+
+    monkeypatch.setattr(AccountStorage, "get_latest_cookies", counting_get_latest_cookies)
+    scraper = TikTokScraper(session=_FakeSession("", {}))
+
+    jar, token = scraper._load_account_cookies("acc")
+    jar_again, _ = scraper._load_account_cookies("acc")
+    assert token == "tok1"
+    assert jar.get("sessionid") == jar_again.get("sessionid") == "s1"
+    assert reads == ["acc"]
+
+    cookies_file.write_text(json.dumps({"cookies": {"msToken": "tok2"}}), encoding="utf-8")
+    stat = cookies_file.stat()
+    os.utime(cookies_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    _, token = scraper._load_account_cookies("acc")
+    assert token == "tok2"
+    assert reads == ["acc", "acc"]
+    assert scraper._load_account_cookies("missing") == (None, None)
+
+
+class _ScriptSigner(scraper_module._SignerWorker):
+    def __init__(self, code):
+        super().__init__(Path("unused.js"))
+        self.code = code
+
+    def _spawn(self):
+        return subprocess.Popen(
+            [sys.executable, "-c", self.code],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def test_signer_worker_reads_response_split_across_writes():
+    signer = _ScriptSigner(
+        "import sys, time\n"
+        "sys.stdin.readline()\n"
+        "sys.stdout.write('{\"ok\": true, '); sys.stdout.flush(); time.sleep(0.1)\n"
+        "sys.stdout.write('\"signature\": \"sig\"}\\n'); sys.stdout.flush(); time.sleep(5)\n"
+    )
+    try:
+        assert signer.sign("https://x", "ua", timeout=3) == "sig"
+    finally:
+        signer.close()
+
+
+def test_signer_worker_kills_stalled_partial_line():
+    signer = _ScriptSigner(
+        "import sys, time\n"
+        "sys.stdin.readline()\n"
+        "sys.stdout.write('{\"ok\": tr'); sys.stdout.flush(); time.sleep(30)\n"
+    )
+    start = time.monotonic()
+    assert signer.sign("https://x", "ua", timeout=0.5) is None
+    assert time.monotonic() - start < 5
+    assert signer._proc is None
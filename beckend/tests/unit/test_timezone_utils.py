@@ -0,0 +1,89 @@
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+BACKEND_ROOT = PROJECT_ROOT / "beckend"
+for entry in (BACKEND_ROOT, BACKEND_ROOT / "src"):
+    path_str = str(entry)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from src import timezone_utils
+
+
+def test_get_app_timezone_returns_singleton():
+    assert timezone_utils.get_app_timezone() is timezone_utils.get_app_timezone()
+    assert timezone_utils.now().tzinfo is timezone_utils.get_app_timezone()
+
+
+def test_utc_local_round_trip():
+    utc_time = datetime(2025, 1, 23, 17, 30, tzinfo=timezone.utc)
+
+    local_time = timezone_utils.utc_to_local(utc_time)
+
+    assert local_time == utc_time
+    assert timezone_utils.local_to_utc(local_time) == utc_time
+    assert timezone_utils.local_to_utc(local_time).tzinfo is timezone.utc
+    assert timezone_utils.local_to_utc(local_time.replace(tzinfo=None)) == utc_time
+
+
+def test_get_timezone_offset_matches_strftime():
+    offset = timezone_utils.now().strftime("%z")
+
+    assert timezone_utils.get_timezone_offset() == f"{offset[:-2]}:{offset[-2:]}"
+
+
+def test_parse_datetime_handles_iso_strings():
+    app_tz = timezone_utils.get_app_timezone()
+
+    naive = timezone_utils.parse_datetime("2025-01-23T14:30:00")
+    utc = timezone_utils.parse_datetime("2025-01-23T17:30:00Z")
+
+    assert naive.tzinfo is app_tz
+    assert utc == naive
+    assert utc.tzinfo is app_tz
+
+
+def test_parse_datetime_sends_non_iso_strings_to_dateutil(monkeypatch):
+    parsed = []
+
+    class _Parser:
+        @staticmethod
+        def parse(value):
+            parsed.append(value)
+            return datetime(2025, 1, 23, 14, 30)
+
+    class _NoFromIso(datetime):
+        @classmethod
+        def fromisoformat(cls, value):
+            raise AssertionError("fromisoformat não deveria ser chamado")
+
+    monkeypatch.setattr(timezone_utils, "_dateutil_parser", _Parser)
+    monkeypatch.setattr(timezone_utils, "datetime", _NoFromIso)
+
+    result = timezone_utils.parse_datetime("January 23, 2025 14:30")
+
+    assert parsed == ["January 23, 2025 14:30"]
+    assert result.tzinfo is timezone_utils.get_app_timezone()
+    assert (result.hour, result.minute) == (14, 30)
+
+
+def test_format_datetime_matches_strftime():
+    local = timezone_utils.utc_to_local(datetime(2025, 1, 3, 7, 5, 9, tzinfo=timezone.utc))
+
+    assert timezone_utils.format_datetime(local, "display") == local.strftime("%d/%m/%Y %H:%M")
+    assert timezone_utils.format_datetime(local, "db") == local.strftime("%Y-%m-%d %H:%M:%S")
+    assert timezone_utils.format_datetime(local) == local.isoformat()
+
+
+def test_is_aware_and_make_aware():
+    naive = datetime(2025, 1, 23, 14, 30)
+
+    aware = timezone_utils.make_aware(naive)
+
+    assert not timezone_utils.is_aware(naive)
+    assert timezone_utils.is_aware(aware)
+    assert aware.tzinfo is timezone_utils.get_app_timezone()
+    assert timezone_utils.make_aware(aware) is aware
+    assert timezone_utils.is_aware(datetime(2025, 1, 1, tzinfo=timezone.utc))